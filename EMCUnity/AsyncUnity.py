@@ -0,0 +1,498 @@
+import asyncio
+import json
+import math
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from . import UnityClasses
+from .Unity import (Unity, MODIFIED_FIELDS, _next_page, _id_filters, _reference_ids,
+                    _apply_references, _and_filter, _compare_snapshot)
+from .UnityColumns import _ResultSetBuilder
+from .UnityMetrics import _MetricQuery, _history_plan, _history_filter, _history_result
+from .UnityRateLimiter import _FAILED
+from .UnityClasses import content_constructor, from_entries
+
+
+class AsyncUnity(Unity):
+    """ Class representing an EMC Unity Array, driven from an asyncio loop
+
+        The per-type accessors (lun(), pool(), alert()...) are shared with
+        Unity and return coroutines, so a single event loop can poll many
+        arrays at once:
+
+            async with AsyncUnity('unity.ktelep.local', 'admin', 'pw') as unity:
+                luns = await unity.lun()
+
+        retry, breaker_threshold, rate_limit and max_inflight work as for
+        Unity, and an expired login session is renewed the same way.
+        Requires Python 3.6+ and the aiohttp module.
+    """
+
+    def __init__(self, ip_addr, username, password, page_workers=1, timeout=None,
+                 limit_per_host=8, session=None, schemas=None, metric_store=None,
+                 retry=None, breaker_threshold=None, breaker_reset=60, rate_limit=None,
+                 max_inflight=None):
+        if aiohttp is None:
+            raise ImportError("AsyncUnity requires the aiohttp module")
+
+        # Results are coroutines, get_object can't cache them
+        self._init_client(ip_addr, username, password, page_workers, timeout,
+                          None, None, schemas, metric_store)
+        self._init_limits(retry, breaker_threshold, breaker_reset, rate_limit, max_inflight)
+        self.limit_per_host = limit_per_host
+
+        # Serialises logins between tasks, created inside the running loop
+        self._login_lock = None
+
+        # The aiohttp session has to be created inside the running loop
+        self.session = session
+        self._owns_session = session is None
+
+    async def connect(self):
+        """ Authenticate and load name, model and software """
+        self._set_system_info(await self.unity_request('/instances/basicSystemInfo/0'))
+        return self
+
+    def _load_system_info(self):
+        raise RuntimeError("await connect() before reading the system information")
+
+    async def close(self):
+        """ Close the HTTP session if we created it """
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __enter__(self):
+        raise TypeError("AsyncUnity is used with 'async with'")
+
+    async def logout(self):
+        """ End the login session on the array and forget it locally """
+        if self.is_auth:
+            try:
+                await self.post('/types/loginSessionInfo/action/logout')
+            finally:
+                self._reset_auth()
+
+    def _reset_auth(self):
+        """ Drop the login session so the next request authenticates again """
+        self.is_auth = False
+        self.headers.pop('EMC-CSRF-TOKEN', None)
+        if self.session is not None:
+            self.session.cookie_jar.clear()
+
+    def _get_session(self):
+        if self.session is None:
+            connector = aiohttp.TCPConnector(ssl=False, limit_per_host=self.limit_per_host)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def unity_request(self, url_path, method = 'GET', payload = None):
+        """ Perform a request to the Unity array, returns the decoded JSON
+            (or None for an empty body) rather than a response object """
+
+        if not payload:
+            payload = dict()
+
+        if method not in ('GET', 'POST', 'DELETE'):
+            return None
+
+        url = self.api_url + url_path
+
+        attempt = 0
+        while True:
+            trial = False
+            if self.breaker is not None:
+                trial = self.breaker.before_request(self.ip_addr)
+
+            try:
+                body = await self._limited_send(url, method, payload)
+
+            except aiohttp.ClientResponseError as e:
+                # A 4xx still shows the array is up and answering
+                self._record_result(e.status < 500 and e.status != 429)
+                if self.retry is None or not self.retry.should_retry(method, attempt, e.status):
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt, e if e.headers is not None else None))
+
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # Connection errors, timeouts, bodies cut off mid-way...
+                self._record_result(False)
+                if self.retry is None or not self.retry.should_retry(method, attempt):
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+
+            else:
+                self._record_result(True)
+                return body
+
+            finally:
+                # Whatever happened, let the breaker try again later
+                if trial:
+                    self.breaker.end_trial()
+
+            attempt += 1
+
+    async def _limited_send(self, url, method, payload):
+        """ _send, waiting for the rate limiter and reporting back to it """
+        if self.rate_limiter is None:
+            return await self._send(url, method, payload)
+
+        while True:
+            wait = self.rate_limiter.try_acquire()
+            if wait == 0:
+                break
+            await asyncio.sleep(0.05 if wait is None else wait)
+
+        started = time.time()
+        status = _FAILED
+        try:
+            body = await self._send(url, method, payload)
+            status = None
+            return body
+        except aiohttp.ClientResponseError as e:
+            status = e.status
+            raise
+        finally:
+            self.rate_limiter.release(time.time() - started, status)
+
+    async def _send(self, url, method, payload):
+        """ Send one request, logging in again if the session has expired """
+
+        if not self.is_auth:
+            # Only one task logs in, the others wait and reuse its session
+            async with self._get_login_lock():
+                if not self.is_auth:
+                    if method == 'GET':
+                        return await self._request(method, url, payload, login = True)
+                    # POST and DELETE need the CSRF token the array returns to a login
+                    await self._login()
+
+        sent_token = self.headers.get('EMC-CSRF-TOKEN')
+        try:
+            return await self._request(method, url, payload)
+        except aiohttp.ClientResponseError as e:
+            if e.status != 401:
+                raise
+
+        # The login session expired.  The first task to notice logs in
+        # again with a GET, then every task replays its request with the
+        # new CSRF token
+        async with self._get_login_lock():
+            if not self.is_auth or self.headers.get('EMC-CSRF-TOKEN') == sent_token:
+                self._reset_auth()
+                await self._login()
+        return await self._request(method, url, payload)
+
+    async def _login(self):
+        """ Log in with a GET, which returns the CSRF token without
+            changing anything on the array """
+        await self._request('GET', self.api_url + '/types/basicSystemInfo/instances', {}, login = True)
+
+    async def _request(self, method, url, payload, login = False):
+        """ Send one request, with basic auth when logging in, and return
+            its decoded body """
+
+        kwargs = {'headers': self._request_headers()}
+        if self.timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=self.timeout)
+        if login:
+            kwargs['auth'] = aiohttp.BasicAuth(self.username, self.password)
+
+        if method != 'POST':
+            kwargs['params'] = payload
+        else: # For POST requests, we pass data, not payload
+            kwargs['data'] = json.dumps(payload)
+
+        async with self._get_session().request(method, url, **kwargs) as response:
+            if login:
+                self._process_login(response)
+            else:
+                self.process_response(response)
+            body = await response.text()
+
+        if not body:
+            return None
+        return json.loads(body)
+
+    def _get_login_lock(self):
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+        return self._login_lock
+
+    async def get_from_type(self, url_path, object_type, payload = None, workers = None):
+        """
+        Performs a request of all fields for a given object_type unless
+        specific fields have been requested as part of the payload,
+        following the 'next' links of collection requests
+        """
+
+        if workers is None:
+            workers = self.page_workers
+
+        payload = self._fields_payload(object_type, payload)
+
+        if workers > 1:
+            payload['with_entrycount'] = 'true'
+
+        response = await self.unity_request(url_path, 'GET', payload = payload)
+
+        if response is None:
+            return None
+
+        elif 'entries' in response:
+            pages = [response]
+            if workers > 1 and _next_page(response) is not None:
+                pages.extend(await self._prefetch_pages(url_path, payload, response, workers) or [])
+
+            next_page = _next_page(pages[-1])
+            while next_page is not None:
+                page = await self.unity_request(url_path, 'GET', payload = dict(payload, page=next_page))
+                pages.append(page)
+                next_page = _next_page(page)
+
+            returned_items = []
+            for page in pages:
+                returned_items.extend(from_entries(object_type, page['entries']))
+            return returned_items
+
+        elif 'content' in response:
+            return content_constructor(object_type)(response['content'])
+
+        else:
+            return None
+
+    async def iter_from_type(self, url_path, object_type, payload = None, per_page = None,
+                             stream = False):
+        """ Lazily yields object_type instances from a collection request,
+            one page at a time (use with 'async for').  Pages are always
+            decoded whole, stream is accepted for compatibility with Unity """
+
+        payload = self._fields_payload(object_type, payload)
+
+        if per_page:
+            payload['per_page'] = per_page
+
+        async for page in self.iter_pages(url_path, payload = payload):
+            for item in from_entries(object_type, page.get('entries', [])):
+                yield item
+
+    async def columnar_from_type(self, url_path, object_type, payload = None, per_page = None):
+        """ A UnityResultSet of a collection request, filled page by page """
+        builder = _ResultSetBuilder(object_type)
+        async for row in self.iter_from_type(url_path, object_type, payload = payload, per_page = per_page):
+            builder.add(row)
+        return builder.build()
+
+    async def iter_pages(self, url_path, payload = None):
+        """ Yields the decoded JSON of each page of a request, following
+            the 'next' links returned by the array (use with 'async for') """
+
+        payload = dict(payload or {})
+
+        while True:
+            page = await self.unity_request(url_path, 'GET', payload = payload)
+            if page is None:
+                return
+            yield page
+
+            next_page = _next_page(page)
+            if next_page is None:
+                return
+            payload['page'] = next_page
+
+    async def _prefetch_pages(self, url_path, payload, first_page, workers):
+        """ Fetch every page after first_page with at most `workers`
+            requests in flight, returning them in order """
+
+        entry_count = first_page.get('entryCount')
+        per_page = int(payload.get('per_page') or len(first_page['entries']))
+        if not entry_count or not per_page:
+            return None
+
+        page_count = int(math.ceil(float(entry_count) / per_page))
+        semaphore = asyncio.Semaphore(workers)
+
+        async def fetch(page):
+            async with semaphore:
+                return await self.unity_request(url_path, 'GET', payload = dict(payload, page=page))
+
+        return await asyncio.gather(*[fetch(page) for page in range(2, page_count + 1)])
+
+    async def _resolve_references(self, response, unity_type, paths, typed = False, workers = None):
+        """ Await response and replace the references at paths with the
+            referenced objects """
+        response = await response
+        if response is None:
+            return None
+
+        items = response if isinstance(response, list) else [response]
+        plan = self._reference_plan(unity_type, paths)
+
+        resolved = dict()
+        for reference_type, ids in _reference_ids(items, plan).items():
+            resolved[reference_type] = await self._fetch_by_ids(reference_type, ids, typed, workers)
+
+        items = _apply_references(items, plan, resolved)
+        return items if isinstance(response, list) else items[0]
+
+    async def _fetch_by_ids(self, unity_type, ids, typed = False, workers = None):
+        """ {id: object} for the unity_type instances with the given ids,
+            with at most `workers` of the filtered queries in flight """
+        semaphore = asyncio.Semaphore(workers or self.page_workers)
+
+        async def fetch(item_filter):
+            async with semaphore:
+                return await self.get_object(unity_type, item_filter = item_filter, typed = typed)
+
+        results = await asyncio.gather(*[fetch(item_filter) for item_filter in _id_filters(sorted(ids))])
+        return dict((item.id, item) for items in results for item in items)
+
+    async def delta(self, unity_type, item_filter = None, modified_field = None):
+        """ The UnityDelta since the previous delta() call for this type
+            and filter, see Unity.delta """
+
+        unity_object = getattr(UnityClasses, "Unity%s" % unity_type)
+        url_path = '/types/%s/instances' % unity_type
+        modified_field = modified_field or MODIFIED_FIELDS.get(unity_type)
+
+        snapshot_key = (unity_type, item_filter)
+        digests, watermark = self._snapshots.get(snapshot_key, (None, None))
+
+        if digests is None or not (modified_field and watermark):
+            current = await self.get_from_type(url_path, unity_object,
+                                               payload = {'filter': item_filter} if item_filter else None)
+            ids = set(item.id for item in current)
+        else:
+            id_payload = {'fields': 'id'}
+            if item_filter:
+                id_payload['filter'] = item_filter
+            ids = set(item.id for item in await self.get_from_type(url_path, unity_object,
+                                                                   payload = id_payload))
+
+            since = '%s ge "%s"' % (modified_field, watermark)
+            current = await self.get_from_type(url_path, unity_object,
+                                               payload = {'filter': _and_filter(item_filter, since)})
+
+            missing = ids - set(digests) - set(item.id for item in current)
+            for id_filter in _id_filters(missing):
+                current.extend(await self.get_from_type(url_path, unity_object,
+                                                        payload = {'filter': _and_filter(item_filter, id_filter)}))
+
+        delta, self._snapshots[snapshot_key] = _compare_snapshot(current, ids, digests,
+                                                                 watermark, modified_field)
+        return delta
+
+    def metric_stream(self, paths, interval = 5, renew_before = 60, typed = False):
+        """ An AsyncMetricStream of real-time samples of the metric paths """
+        return AsyncMetricStream(self, paths, interval, renew_before, typed)
+
+    async def metric_history(self, paths, start, end = None, interval = None, workers = 8,
+                             samples_per_window = 1000):
+        """ Historical metricValue samples of the metric paths, see
+            Unity.metric_history, with at most `workers` windows in flight """
+        now = time.time()
+        collection, paths, start, end, windows = _history_plan(
+            await self.metricCollection(), paths, start, end, interval, samples_per_window, now,
+            self.metric_store, self.ip_addr)
+        semaphore = asyncio.Semaphore(workers)
+
+        async def fetch(path, window_start, window_end):
+            async with semaphore:
+                return await self.metricValue(item_filter = _history_filter(path, collection.interval,
+                                                                            window_start, window_end),
+                                              per_page = samples_per_window)
+
+        results = await asyncio.gather(*[fetch(*window) for window in windows])
+        return _history_result(paths, windows, results, start, end, collection.interval, now,
+                               self.metric_store, self.ip_addr)
+
+    async def _create_storage_resource(self, action, payload):
+        """ Run a storageResource create action, returns the new lun object """
+        response = await self.post('/types/storageResource/action/%s' % action, payload)
+
+        new_id = response['content']['storageResource']['id']
+        return await self.lun(item_id=new_id)
+
+    def __repr__(self):
+        return "<AsyncUnity Array: %s>" % self.ip_addr
+
+
+class AsyncMetricStream(_MetricQuery):
+    """ MetricStream for AsyncUnity, used with 'async for':
+
+            async with unity.metric_stream(paths, interval=10) as stream:
+                async for sample in stream:
+                    ...
+
+        The query's expiration is measured against the local clock.
+    """
+
+    def __init__(self, unity, paths, interval=5, renew_before=60, typed=False):
+        super(AsyncMetricStream, self).__init__(paths, interval, renew_before)
+        self.unity = unity
+        self.typed = typed
+
+    def __aiter__(self):
+        return self._samples()
+
+    async def _samples(self):
+        try:
+            while not self.closed:
+                await asyncio.sleep(self._wait())
+                for sample in await self.poll():
+                    yield sample
+        finally:
+            await self.close()
+
+    async def poll(self):
+        """ New samples since the last poll, without waiting """
+        if self._needs_query():
+            await self._create_query()
+        results = await self.unity.metricQueryResult(item_id=self.query_id, typed=self.typed)
+        return self._store(self._new_samples(results))
+
+    async def _create_query(self):
+        old_query = self.query_id
+        response = await self.unity.post('/types/metricRealTimeQuery/instances', self._payload())
+
+        self._set_query(response['content'])
+        if self.expires is None:
+            query = await self.unity.get('/instances/metricRealTimeQuery/%s' % self.query_id,
+                                         {'fields': 'id,expiration'})
+            self._set_query(query['content'])
+
+        if old_query is not None:
+            await self._delete_query(old_query)
+
+    async def _delete_query(self, query_id):
+        """ Delete a query on the array, it expires by itself if that fails """
+        try:
+            await self.unity.delete('/instances/metricRealTimeQuery/%s' % query_id)
+        except aiohttp.ClientError:
+            pass
+
+    async def close(self):
+        """ Stop the stream and delete its query """
+        self.closed = True
+        if self.query_id is not None:
+            query_id, self.query_id = self.query_id, None
+            await self._delete_query(query_id)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __repr__(self):
+        return "<Unity Async Metric Stream: %d paths every %ss>" % (len(self.paths), self.interval)
@@ -1,72 +1,517 @@
 import requests
 import json
-import UnityClasses
-from .UnityClasses import *
+import itertools
+import math
+import re
+import threading
+import time
+from collections import namedtuple
+from . import UnityClasses
+from .UnityColumns import UnityResultSet
+from .UnityMetrics import MetricStream, _history_plan, _history_filter, _history_result
+from .UnityRateLimiter import RateLimiter, _FAILED
+from .UnityRetry import CircuitBreaker
+from .UnitySchema import _default_registry
+from .UnityStream import iter_entries
+from .UnityTyped import typed_type, nested_type, _field_type, _named_type
 
 requests.packages.urllib3.disable_warnings()
 
-class Unity:
-    """ Class representing an EMC Unity Array """
+try:
+    string_types = basestring
+except NameError:  # Python 3
+    string_types = str
+
+# Cached types affected by creating or deleting a storage resource
+_STORAGE_TYPES = ('lun', 'storageResource', 'pool', 'hostLUN')
+
+_NOT_CACHED = object()
+
+# Fields that move forward whenever an instance changes, used by delta()
+# to only ask the array for instances modified since the last poll
+MODIFIED_FIELDS = {'cifsShare': 'modifiedTime',
+                   'event': 'creationTime',
+                   'nfsShare': 'modificationTime',
+                   'technicalAdvisory': 'modificationTime'}
+
+UnityDelta = namedtuple('UnityDelta', ['added', 'removed', 'changed'])
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_PAGE_RE = re.compile(r'(?:^|[?&])page=(\d+)')
+
+def _thread_pool(workers):
+    """ A ThreadPool of workers threads.  multiprocessing is imported on
+        first use as it is slow to import and most scripts never need it """
+    from multiprocessing.pool import ThreadPool
+    return ThreadPool(workers)
+
+def _next_page(response):
+    """ Return the page number of the 'next' link in a collection response,
+        or None when this is the last page """
+    for link in response.get('links', []):
+        if link.get('rel') == 'next':
+            match = _PAGE_RE.search(link.get('href', ''))
+            if match:
+                return int(match.group(1))
+    return None
+
+_projections = dict()
+
+def _field_list(fields, object_type):
+    """ Normalise a list or comma separated string of fields, with 'id'
+        first when object_type has one """
+    if isinstance(fields, string_types):
+        fields = fields.split(',')
+    fields = [field.strip() for field in fields if field.strip()]
+    if 'id' in object_type._fields and 'id' not in fields:
+        fields.insert(0, 'id')
+    return fields
+
+def _projection(object_type, fields, schema = None):
+    """ A namedtuple type named like object_type holding only fields.  A
+        dotted field ('pool.name') is held by its first part, and built
+        when read as a projection of the type that part refers to """
+    key = (object_type.__name__, tuple(fields), schema)
+    if key not in _projections:
+        names = []
+        nested = dict()
+        for field in fields:
+            name, _, rest = field.partition('.')
+            if name not in names:
+                names.append(name)
+            if rest:
+                nested.setdefault(name, []).append(rest)
+
+        T = UnityClasses.namedtuple_defaults(object_type.__name__, names)
+
+        nested_types = dict()
+        for name, nested_fields in nested.items():
+            type_name = _field_type(object_type.__name__[len('Unity'):], name, schema)
+            if type_name:
+                nested_object = getattr(UnityClasses, 'Unity%s' % type_name)
+                if 'id' in nested_object._fields and 'id' not in nested_fields:
+                    nested_fields.insert(0, 'id')
+                nested_types[name] = _projection(nested_object, nested_fields, schema)
+        if nested_types:
+            T = nested_type(T, nested_types)
+
+        # The type can't be pickled by name, UnityClasses holds the full one
+        type_name, fields = object_type.__name__, tuple(fields)
+        T.__reduce__ = lambda self: (_rebuild_projection, (type_name, fields, tuple(self)))
+
+        _projections[key] = T
+    return _projections[key]
+
+def _rebuild_projection(type_name, fields, values):
+    """ Unpickle an instance of a projection """
+    T = _projection(getattr(UnityClasses, type_name), list(fields))
+    return tuple.__new__(T, values)
+
+def _id_filters(ids, chunk_size=50):
+    """ Yield filters matching the given ids, chunk_size ids at a time to
+        keep the request URL short """
+    ids = list(ids)
+    for start in range(0, len(ids), chunk_size):
+        yield '(%s)' % ' || '.join('id eq "%s"' % i for i in ids[start:start + chunk_size])
+
+def _and_filter(*filters):
+    """ Combine filters, skipping empty ones """
+    return ' && '.join(f for f in filters if f)
+
+def _paths(paths):
+    """ Normalise a list or comma separated string of dotted field paths """
+    if isinstance(paths, string_types):
+        paths = paths.split(',')
+    return [path.strip() for path in paths if path.strip()]
+
+def _references(value, segments):
+    """ Yield the {'id': ...} reference dicts found below value by
+        following the remaining path segments through dicts and lists """
+    if isinstance(value, list):
+        for item in value:
+            for reference in _references(item, segments):
+                yield reference
+    elif isinstance(value, dict):
+        if not segments:
+            if 'id' in value:
+                yield value
+        else:
+            for reference in _references(value.get(segments[0]), segments[1:]):
+                yield reference
+
+def _replace_references(value, segments, resolved):
+    """ A copy of value with the references below it replaced by the
+        resolved objects, where one was found """
+    if isinstance(value, list):
+        return [_replace_references(item, segments, resolved) for item in value]
+    if isinstance(value, dict):
+        if not segments:
+            return resolved.get(value.get('id'), value)
+        if segments[0] in value:
+            value = dict(value)
+            value[segments[0]] = _replace_references(value[segments[0]], segments[1:], resolved)
+    return value
+
+def _reference_ids(items, plan):
+    """ The ids referenced by items for each referenced type """
+    ids = dict()
+    for path, field, segments, reference_type in plan:
+        type_ids = ids.setdefault(reference_type, set())
+        for item in items:
+            index = item._fields.index(field)
+            type_ids.update(reference['id'] for reference in _references(item[index], segments))
+    return ids
+
+def _apply_references(items, plan, resolved):
+    """ Copies of items with their references replaced by the objects in
+        resolved ({type: {id: object}}) """
+    for path, field, segments, reference_type in plan:
+        objects = resolved.get(reference_type, {})
+        items = [item._replace(**{field: _replace_references(item[item._fields.index(field)],
+                                                             segments, objects)})
+                 for item in items]
+    return items
+
+def _digest(item):
+    """ Hash of every field of an instance, used to spot changes """
+    return hash(json.dumps(item._asdict(), sort_keys=True, default=str))
+
+def _compare_snapshot(current, ids, digests, watermark, modified_field):
+    """ The UnityDelta of current (the instances downloaded, all of them
+        or those modified since watermark) and ids (every instance id)
+        against the previous digests, and the new (digests, watermark) """
+    previous = digests or dict()
+    digests = dict((item_id, digest) for item_id, digest in previous.items() if item_id in ids)
+
+    added, changed = [], []
+    for item in current:
+        digest = _digest(item)
+        if item.id not in previous:
+            added.append(item)
+        elif previous[item.id] != digest:
+            changed.append(item)
+        digests[item.id] = digest
+
+        if modified_field:
+            stamp = getattr(item, modified_field, None)
+            if stamp and (watermark is None or stamp > watermark):
+                watermark = stamp
+
+    removed = [item_id for item_id in previous if item_id not in ids]
+    return UnityDelta(added, removed, changed), (digests, watermark)
+
+class Unity(object):
+    """ Class representing an EMC Unity Array
+
+        With lazy=True nothing is sent to the array until the first request,
+        and name, model and software are loaded when first read.
+    """
+
+    def __init__(self, ip_addr, username, password, page_workers=1, timeout=None,
+                 cache=None, session_store=None, lazy=False, pool_maxsize=None,
+                 pool_block=False, idle_timeout=None, retry=None,
+                 breaker_threshold=None, breaker_reset=60, rate_limit=None,
+                 max_inflight=None, schemas=None, metric_store=None):
+        self._init_client(ip_addr, username, password, page_workers, timeout,
+                          cache, session_store, schemas, metric_store)
+
+        # One connection pool for the array, sized for the threads sharing
+        # it (page prefetch, fleets, callers' own workers)
+        self.session = requests.Session()
+        self._adapter = requests.adapters.HTTPAdapter(pool_connections=1,
+                                                      pool_maxsize=pool_maxsize or max(10, page_workers),
+                                                      pool_block=pool_block)
+        self.session.mount('https://', self._adapter)
+
+        # Keep-alive connections idle for longer than this are closed before
+        # the next request rather than risking a socket the SP has dropped
+        self.idle_timeout = idle_timeout
+        self._last_request = None
+
+        self._init_limits(retry, breaker_threshold, breaker_reset, rate_limit, max_inflight)
+
+        self._restore_session()
+
+        if not lazy:
+            self._load_system_info()
 
-    def __init__(self, ip_addr, username, password):
+    def _init_client(self, ip_addr, username, password, page_workers, timeout,
+                     cache, session_store, schemas, metric_store):
+        """ State shared by Unity and AsyncUnity, whatever the transport """
         self.ip_addr = ip_addr
         self.username = username
         self.password = password
         self.is_auth = False
+        self.page_workers = page_workers
+        self.timeout = timeout
+        self.cache = cache
+        self.session_store = session_store
+        self.metric_store = metric_store
+        self._snapshots = dict()
         self.api_url = 'https://%s/api' % self.ip_addr
 
         self.headers = {'Accept':'application/json',
                         'Content-type':'application/json',
                         'X-EMC-REST-CLIENT':'true'}
 
-        self.session = requests.Session()
+        # Serialises logins and changes to the CSRF header between threads
+        self._auth_lock = threading.RLock()
+
+        # Schema of the array's API version, picked once it is known
+        self.schemas = schemas if schemas is not None else _default_registry
+        self._schema = _NOT_CACHED
+
+        self._system_info = None
+
+    def _init_limits(self, retry, breaker_threshold, breaker_reset, rate_limit, max_inflight):
+        """ Retries, circuit breaker and rate limiter, shared by Unity and
+            AsyncUnity """
+        # Retries of failed requests, and a breaker that fails fast once
+        # breaker_threshold requests in a row have failed
+        self.retry = retry
+        self.breaker = None
+        if breaker_threshold:
+            self.breaker = CircuitBreaker(breaker_threshold, breaker_reset)
+
+        # Requests per second and concurrent requests allowed to this array,
+        # the rate adapted to the latency and 429/503 answers of the SP.
+        # max_inflight alone doesn't limit the rate
+        self.rate_limiter = None
+        if rate_limit or max_inflight:
+            self.rate_limiter = RateLimiter(rate_limit or None, max_inflight)
+
+    def _load_system_info(self):
+        self._set_system_info(self.unity_request('/instances/basicSystemInfo/0').json())
+
+    def _set_system_info(self, sys_info):
+        """ Keep the content of a basicSystemInfo response """
+        self._system_info = sys_info['content']
+
+    @property
+    def system_info(self):
+        """ basicSystemInfo content of the array, loaded on first use """
+        if self._system_info is None:
+            self._load_system_info()
+        return self._system_info
+
+    @property
+    def schema(self):
+        """ UnitySchema matching the array's apiVersion, or None when
+            there is no schema for it """
+        if self._schema is _NOT_CACHED:
+            schema = None
+            if self.schemas.versions():
+                schema = self.schemas.get(self.system_info.get('apiVersion'))
+            self._schema = schema
+        return self._schema
+
+    @property
+    def name(self):
+        return self.system_info['name']
+
+    @property
+    def model(self):
+        return self.system_info['model']
+
+    @property
+    def software(self):
+        return self.system_info['softwareVersion']
+
+    def _restore_session(self):
+        """ Reuse a login session from the session store, if there is one """
+        if self.session_store is None:
+            return
+
+        stored = self.session_store.load(self.ip_addr, self.username)
+        if stored and stored.get('csrf_token'):
+            self.session.cookies.update(stored['cookies'])
+            self.headers['EMC-CSRF-TOKEN'] = stored['csrf_token']
+            self.is_auth = True
 
-        sys_info = self.unity_request('/instances/basicSystemInfo/0').json()
-        self.name = sys_info['content']['name']
-        self.model = sys_info['content']['model']
-        self.software = sys_info['content']['softwareVersion']
+    def _save_session(self):
+        """ Write the current login session to the session store """
+        if self.session_store is not None and self.is_auth:
+            self.session_store.save(self.ip_addr, self.username,
+                                    requests.utils.dict_from_cookiejar(self.session.cookies),
+                                    self.headers['EMC-CSRF-TOKEN'])
+
+    def _reset_auth(self):
+        """ Drop the login session so the next request authenticates again """
+        with self._auth_lock:
+            self.is_auth = False
+            self.headers.pop('EMC-CSRF-TOKEN', None)
+            self.session.cookies.clear()
+            if self.session_store is not None:
+                self.session_store.discard(self.ip_addr, self.username)
+
+    def logout(self):
+        """ End the login session on the array and forget it locally """
+        if self.is_auth:
+            try:
+                self.post('/types/loginSessionInfo/action/logout')
+            finally:
+                self._reset_auth()
 
     def process_response(self, response):
         """ Process the HTTPS response and set headers or raise exceptions """
         # TODO: work with Exceptions for easier troubleshooting
         response.raise_for_status()
 
-        if 'EMC-CSRF-TOKEN' not in self.headers:
-            self.headers['EMC-CSRF-TOKEN'] = response.headers.get('emc-csrf-token')
+        # Under the lock, or a token could be taken from a response to the
+        # session another thread has just replaced
+        with self._auth_lock:
+            if not self.headers.get('EMC-CSRF-TOKEN'):
+                token = response.headers.get('emc-csrf-token')
+                if token:
+                    self.headers['EMC-CSRF-TOKEN'] = token
 
-        if self.headers['EMC-CSRF-TOKEN']:
-            self.is_auth = True
+            if self.headers.get('EMC-CSRF-TOKEN'):
+                self.is_auth = True
 
         return
 
-    def get_from_type(self, url_path, object_type, payload = None):
+    def get_from_type(self, url_path, object_type, payload = None, workers = None):
         """
         Performs a request of all fields for a given object_type unless
-        specific fields have been requested as part of the payload
+        specific fields have been requested as part of the payload.
+        Collection requests follow the 'next' links until every page
+        has been read, fetching up to `workers` pages at once when the
+        first page reports the total entry count.
         """
 
-        if not payload:
-            payload = dict()
+        if workers is None:
+            workers = self.page_workers
 
-        if 'fields' not in payload:
-            payload['fields'] = ",".join(object_type._fields)
+        payload = self._fields_payload(object_type, payload)
 
-        response = self.unity_request(url_path,'GET',payload = payload).json()
+        if workers > 1:
+            payload['with_entrycount'] = 'true'
+
+        pages = self.iter_pages(url_path, payload = payload)
+        response = next(pages)
 
         if 'entries' in response:
+            if workers > 1 and _next_page(response) is not None:
+                prefetched = self._prefetch_pages(url_path, payload, response, workers)
+                if prefetched is not None:
+                    # Entries added since entryCount was read are on later pages
+                    next_page = _next_page(prefetched[-1])
+                    pages = prefetched
+                    if next_page is not None:
+                        pages = itertools.chain(prefetched,
+                                                self.iter_pages(url_path, dict(payload, page=next_page)))
+
             returned_items = []
-            for item in response['entries']:
-                returned_items.append(object_type(**item['content']))
+            for page in itertools.chain([response], pages):
+                returned_items.extend(UnityClasses.from_entries(object_type, page['entries']))
             return returned_items
 
         elif 'content' in response:
-            return object_type(**response['content'])
+            return UnityClasses.content_constructor(object_type)(response['content'])
 
         else:
             return None
 
-    def unity_request(self, url_path, method = 'GET', payload = None):
-        """ Perform a request to the Unity array """
+    def iter_from_type(self, url_path, object_type, payload = None, per_page = None,
+                       stream = False):
+        """
+        Lazily yields object_type instances from a collection request, one
+        page at a time, so only a single page is held in memory.  With
+        stream=True each page is parsed straight from the socket and only
+        one entry is held in memory at a time.
+        """
+
+        payload = self._fields_payload(object_type, payload)
+
+        if per_page:
+            payload['per_page'] = per_page
+
+        if not stream:
+            for page in self.iter_pages(url_path, payload = payload):
+                for item in UnityClasses.from_entries(object_type, page.get('entries', [])):
+                    yield item
+            return
+
+        construct = UnityClasses.content_constructor(object_type)
+        while True:
+            response = self.unity_request(url_path, 'GET', payload = payload, stream = True)
+            meta = dict()
+            try:
+                for item in iter_entries(response.iter_content(_STREAM_CHUNK_SIZE), meta):
+                    yield construct(item['content'])
+            finally:
+                response.close()
+
+            next_page = _next_page(meta)
+            if next_page is None:
+                return
+            payload['page'] = next_page
+
+    def columnar_from_type(self, url_path, object_type, payload = None, per_page = None):
+        """ A UnityResultSet of a collection request.  Columns are filled
+            page by page, the full list is never built """
+        rows = self.iter_from_type(url_path, object_type, payload = payload, per_page = per_page)
+        return UnityResultSet.from_rows(object_type, rows)
+
+    def iter_pages(self, url_path, payload = None):
+        """ Yields the decoded JSON of each page of a request, following
+            the 'next' links returned by the array """
+
+        payload = dict(payload or {})
+
+        while True:
+            response = self.unity_request(url_path, 'GET', payload = payload).json()
+            yield response
+
+            next_page = _next_page(response)
+            if next_page is None:
+                return
+            payload['page'] = next_page
+
+    def _prefetch_pages(self, url_path, payload, first_page, workers):
+        """ Fetch every page after first_page concurrently, returning them in
+            order.  Returns None if the page count can't be determined """
+
+        entry_count = first_page.get('entryCount')
+        per_page = int(payload.get('per_page') or len(first_page['entries']))
+        if not entry_count or not per_page:
+            return None
+
+        page_count = int(math.ceil(float(entry_count) / per_page))
+        if page_count < 2:
+            return None
+
+        def fetch(page):
+            page_payload = dict(payload, page=page)
+            return self.unity_request(url_path, 'GET', payload = page_payload).json()
+
+        pool = _thread_pool(min(workers, page_count - 1))
+        try:
+            return pool.map(fetch, range(2, page_count + 1))
+        finally:
+            pool.close()
+            pool.join()
+
+    def _fields_payload(self, object_type, payload):
+        """ Copy the payload, requesting every field of object_type the
+            array supports unless specific fields have already been
+            requested """
+
+        payload = dict(payload or {})
+
+        if 'fields' not in payload:
+            schema = self.schema
+            if schema is None:
+                payload['fields'] = ",".join(object_type._fields)
+            else:
+                payload['fields'] = ",".join(schema.supported_fields(object_type))
+
+        return payload
+
+    def unity_request(self, url_path, method = 'GET', payload = None, stream = False):
+        """ Perform a request to the Unity array.  With stream=True the body
+            is left unread so it can be consumed incrementally """
 
         if not payload:
             payload = dict()
@@ -82,32 +527,157 @@ class Unity:
         else:
             return None
 
-        if method != 'POST':
-            if self.is_auth:
-                response = request_function(url, verify = False,
-                                            headers = self.headers,
-                                            params = payload)
+        attempt = 0
+        while True:
+            trial = False
+            if self.breaker is not None:
+                trial = self.breaker.before_request(self.ip_addr)
+
+            try:
+                response = self._limited_send(request_function, url, method, payload, stream)
+
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code
+                # A 4xx still shows the array is up and answering
+                self._record_result(status < 500 and status != 429)
+                if self.retry is None or not self.retry.should_retry(method, attempt, status):
+                    raise
+                time.sleep(self.retry.delay(attempt, e.response))
+
+            except requests.exceptions.RequestException:
+                # Connection errors, timeouts, bodies cut off mid-way...
+                self._record_result(False)
+                if self.retry is None or not self.retry.should_retry(method, attempt):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+
             else:
-                response = request_function(url, verify = False,
-                                            auth = (self.username, self.password),
-                                            headers = self.headers,
-                                            params = payload)
-        else: # For POST requests, we pass data, not payload
-            payload = json.dumps(payload)
-            if self.is_auth:
-                response = request_function(url, verify = False,
-                                            headers = self.headers,
-                                            data = payload)
+                self._record_result(True)
+                return response
+
+            finally:
+                # Whatever happened, let the breaker try again later
+                if trial:
+                    self.breaker.end_trial()
+
+            attempt += 1
+
+    def _limited_send(self, request_function, url, method, payload, stream):
+        """ _send, waiting for the rate limiter and reporting back to it """
+        if self.rate_limiter is None:
+            return self._locked_send(request_function, url, method, payload, stream)
+
+        self.rate_limiter.acquire()
+        started = time.time()
+        status = _FAILED
+        try:
+            response = self._locked_send(request_function, url, method, payload, stream)
+            status = response.status_code
+            return response
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code
+            raise
+        finally:
+            self.rate_limiter.release(time.time() - started, status)
+
+    def _locked_send(self, request_function, url, method, payload, stream):
+        if self.is_auth:
+            return self._send(request_function, url, method, payload, stream)
+
+        # Only one thread logs in, the others wait and reuse its session
+        with self._auth_lock:
+            return self._send(request_function, url, method, payload, stream)
+
+    def _record_result(self, success):
+        if self.breaker is not None:
+            if success:
+                self.breaker.success()
             else:
-                response = request_function(url, verify = False,
-                                            auth = (self.username, self.password),
-                                            headers = self.headers,
-                                            data = payload)
+                self.breaker.failure()
 
-        self.process_response(response)
+    def _send(self, request_function, url, method, payload, stream):
+        """ Send one request, logging in again if the session has expired """
+
+        self._close_idle_connections()
+
+        if not self.is_auth and method != 'GET':
+            # POST and DELETE need the CSRF token the array returns to a login
+            self._login()
+
+        kwargs = {'verify': False,
+                  'headers': self._request_headers(),
+                  'timeout': self.timeout,
+                  'stream': stream}
+
+        if not self.is_auth:
+            kwargs['auth'] = (self.username, self.password)
+
+        if method != 'POST':
+            kwargs['params'] = payload
+        else: # For POST requests, we pass data, not payload
+            kwargs['data'] = json.dumps(payload)
+
+        response = request_function(url, **kwargs)
+        self._last_request = time.time()
+
+        if response.status_code == 401 and 'auth' not in kwargs:
+            # The login session expired.  The first thread to notice logs
+            # in again with a GET, then every thread replays its request
+            # with the new CSRF token
+            sent_token = kwargs['headers'].get('EMC-CSRF-TOKEN')
+            with self._auth_lock:
+                if not self.is_auth or self.headers.get('EMC-CSRF-TOKEN') == sent_token:
+                    self._reset_auth()
+                    self._login()
+                kwargs['headers'] = self._request_headers()
+            response = request_function(url, **kwargs)
+            self._last_request = time.time()
+
+        if self.is_auth:
+            self.process_response(response)
+        else:
+            with self._auth_lock:
+                self._process_login(response)
 
         return response
 
+    def _login(self):
+        """ Log in with a GET, which returns the CSRF token without
+            changing anything on the array """
+        response = self.session.get(self.api_url + '/types/basicSystemInfo/instances',
+                                    verify=False, headers=self._request_headers(),
+                                    auth=(self.username, self.password), timeout=self.timeout)
+        self._last_request = time.time()
+        self._process_login(response)
+
+    def _process_login(self, response):
+        """ process_response, saving the session if this response logged us in """
+        was_auth = self.is_auth
+        self.process_response(response)
+
+        if self.is_auth and not was_auth:
+            self._save_session()
+
+    def _request_headers(self):
+        """ Copy of the headers, safe to use while another thread logs in """
+        with self._auth_lock:
+            return dict(self.headers)
+
+    def _close_idle_connections(self):
+        if (self.idle_timeout is not None and self._last_request is not None
+                and time.time() - self._last_request > self.idle_timeout):
+            self._adapter.close()
+
+    def close(self):
+        """ Close the pooled connections to the array """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def get(self, url_path, payload = None):
         """ Wrapper for performing a GET unity request """
         return self.unity_request(url_path, method='GET', payload = payload)
@@ -120,579 +690,808 @@ class Unity:
         """ Wrapper for performing a DELETE unity request """
         return self.unity_request(url_path, method='DELETE', payload = payload)
 
-    def get_object(self, unity_type, item_filter = None, item_id=None, item_name=None):
-        """ Get an object (singular or a collection) """
-
-        payload = dict()
+    def get_object(self, unity_type, item_filter = None, item_id=None, item_name=None,
+                   paginate=False, per_page=None, workers=None, fields=None, compact=False,
+                   stream=False, columnar=False, typed=False, resolve=None):
+        """ Get an object (singular or a collection)
+
+            fields (a list or comma separated string) limits the request to
+            those fields, and the result to a slimmer tuple of the same
+            name holding only them ('id' is included when the type has
+            one).  Dotted fields ('pool.name') are read in the same request
+            and returned as slim objects of the referenced type
+            (lun.pool.name).  compact=True asks the array to leave links
+            and other metadata out of the response.
+
+            With paginate=True a collection request returns a generator that
+            reads the collection per_page entries at a time instead of a list.
+            stream=True also decodes each page incrementally from the socket.
+            columnar=True returns a compact UnityResultSet instead of a list.
+            With typed=True timestamps, enums and nested objects are decoded
+            when a field is first read (see UnityTyped.typed_type).
+
+            resolve (a list or comma separated string of fields, dotted for
+            references in nested attributes: 'hostAccess.host') replaces
+            {'id': ...} references with the referenced objects, fetched
+            with one filtered query per referenced type and 50 ids.  The
+            resolved fields are added to fields when it doesn't list them.
+            Otherwise up to `workers` pages (default: page_workers) are
+            fetched concurrently once the entry count is known.
+
+            When the Unity has a cache, non-paginated results are served
+            from it until the type's TTL expires.
+        """
 
         # Take the unity_type string passed in and determine the actual object
         unity_object = getattr(UnityClasses, "Unity%s" % unity_type)
 
+        if fields:
+            fields = _field_list(fields, unity_object)
+
+        if resolve:
+            resolve = tuple(_paths(resolve))
+            if paginate or stream or columnar:
+                raise ValueError("resolve can't be combined with paginate, stream or columnar")
+            for path in resolve:
+                field = path.split('.')[0]
+                if field not in unity_object._fields:
+                    raise ValueError("Can't resolve %s: %s has no field %s" % (path, unity_type, field))
+                # References are only resolved if they are read
+                if fields and field not in [name.partition('.')[0] for name in fields]:
+                    fields.append(field)
+
+        cache_key = None
+        if self.cache is not None and not (paginate or stream):
+            cache_key = (unity_type, item_filter, item_id, item_name,
+                         tuple(fields or ()), compact, columnar, typed, resolve)
+            cached = self.cache.get(cache_key, _NOT_CACHED)
+            if cached is not _NOT_CACHED:
+                return list(cached) if isinstance(cached, list) else cached
+
+        payload = dict()
+
+        if fields:
+            unity_object = _projection(unity_object, fields, self.schema)
+            payload['fields'] = ",".join(fields)
+
+        if typed:
+            unity_object = typed_type(unity_object, self.schema)
+
+        if compact:
+            payload['compact'] = 'true'
+
         if item_filter:
             payload['filter'] = item_filter
 
-        if not item_id and not item_name: # Request is for all objects
-            response = self.get_from_type('/types/%s/instances' % unity_type, unity_object, payload = payload)
-            return response
-
-        if item_id:  # Request is for a specific ID
-            response = self.get_from_type('/instances/%s/%s' % (unity_type, item_id), unity_object, payload = payload)
-        elif item_name: # Request is for a specific name
+        if item_name and not item_id: # Request is for a specific name
             if 'filter' in payload:
                 payload['filter'] = payload['filter'] + ' && name eq "%s"' % item_name
             else:
                 payload['filter'] = 'name eq "%s"' % item_name
 
-            response = self.get_from_type('/types/%s/instances' % unity_type, unity_object, payload = payload)
+        if item_id:  # Request is for a specific ID
+            response = self.get_from_type('/instances/%s/%s' % (unity_type, item_id), unity_object, payload = payload)
+        elif paginate or stream:
+            response = self.iter_from_type('/types/%s/instances' % unity_type, unity_object,
+                                           payload = payload, per_page = per_page, stream = stream)
+        elif columnar:
+            response = self.columnar_from_type('/types/%s/instances' % unity_type, unity_object,
+                                               payload = payload, per_page = per_page)
+        else: # Request is for all objects, or those matching the filter/name
+            if per_page:
+                payload['per_page'] = per_page
+            response = self.get_from_type('/types/%s/instances' % unity_type, unity_object,
+                                          payload = payload, workers = workers)
+
+        if resolve:
+            response = self._resolve_references(response, unity_type, resolve, typed, workers)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, list(response) if isinstance(response, list) else response)
 
         return response
 
+    def _reference_plan(self, unity_type, paths):
+        """ (path, field, remaining segments, referenced type) for each
+            dotted reference path of unity_type """
+        schema = self.schema
+        plan = []
+        for path in paths:
+            segments = path.split('.')
+
+            # Follow the schema through embedded types, guess from the
+            # name of the last field without one
+            reference_type = unity_type
+            for segment in segments:
+                spec = schema.field(reference_type, segment) if schema is not None else None
+                reference_type = spec and (spec.get('ref') or spec.get('embedded'))
+                if not reference_type:
+                    reference_type = _named_type(segments[-1])
+                    break
+
+            if not reference_type:
+                raise ValueError("Can't tell which type %s.%s refers to" % (unity_type, path))
+            plan.append((path, segments[0], segments[1:], reference_type))
+        return plan
+
+    def _resolve_references(self, response, unity_type, paths, typed = False, workers = None):
+        """ Replace the references at paths in response (an object or a
+            list) with the referenced objects """
+        if response is None:
+            return None
+
+        items = response if isinstance(response, list) else [response]
+        plan = self._reference_plan(unity_type, paths)
+
+        resolved = dict()
+        for reference_type, ids in _reference_ids(items, plan).items():
+            resolved[reference_type] = self._fetch_by_ids(reference_type, ids, typed, workers)
+
+        items = _apply_references(items, plan, resolved)
+        return items if isinstance(response, list) else items[0]
+
+    def _fetch_by_ids(self, unity_type, ids, typed = False, workers = None):
+        """ {id: object} for the unity_type instances with the given ids,
+            running up to `workers` of the filtered queries at once """
+        if workers is None:
+            workers = self.page_workers
+
+        def fetch(item_filter):
+            return self.get_object(unity_type, item_filter = item_filter, typed = typed)
+
+        filters = list(_id_filters(sorted(ids)))
+        if workers > 1 and len(filters) > 1:
+            pool = _thread_pool(min(workers, len(filters)))
+            try:
+                results = pool.map(fetch, filters)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [fetch(item_filter) for item_filter in filters]
+
+        return dict((item.id, item) for items in results for item in items)
+
+    def invalidate_cache(self, *unity_types):
+        """ Drop cached results for the given types (or all types) """
+        if self.cache is not None:
+            self.cache.invalidate(*unity_types)
+
+    def delta(self, unity_type, item_filter = None, modified_field = None):
+        """
+        Returns a UnityDelta of the instances added, removed (as ids) and
+        changed since the previous delta() call for this type and filter.
+        The first call reports every instance as added.
+
+        For types with a modification timestamp (MODIFIED_FIELDS, or
+        modified_field) only instances modified since the last poll are
+        downloaded in full; the rest of the collection is checked by id.
+        """
+
+        unity_object = getattr(UnityClasses, "Unity%s" % unity_type)
+        url_path = '/types/%s/instances' % unity_type
+        modified_field = modified_field or MODIFIED_FIELDS.get(unity_type)
+
+        snapshot_key = (unity_type, item_filter)
+        digests, watermark = self._snapshots.get(snapshot_key, (None, None))
+
+        if digests is None or not (modified_field and watermark):
+            # Full download, compared field by field with the last snapshot
+            current = self.get_from_type(url_path, unity_object,
+                                         payload = {'filter': item_filter} if item_filter else None)
+            ids = set(item.id for item in current)
+        else:
+            id_payload = {'fields': 'id'}
+            if item_filter:
+                id_payload['filter'] = item_filter
+            ids = set(item.id for item in self.get_from_type(url_path, unity_object, payload = id_payload))
+
+            since = '%s ge "%s"' % (modified_field, watermark)
+            current = self.get_from_type(url_path, unity_object,
+                                         payload = {'filter': _and_filter(item_filter, since)})
+
+            # New instances the timestamp filter didn't catch
+            missing = ids - set(digests) - set(item.id for item in current)
+            for id_filter in _id_filters(missing):
+                current.extend(self.get_from_type(url_path, unity_object,
+                                                  payload = {'filter': _and_filter(item_filter, id_filter)}))
+
+        delta, self._snapshots[snapshot_key] = _compare_snapshot(current, ids, digests,
+                                                                 watermark, modified_field)
+        return delta
+
+    def reset_delta(self, unity_type = None):
+        """ Forget the delta() snapshots of one type, or of every type """
+        for key in list(self._snapshots):
+            if unity_type is None or key[0] == unity_type:
+                del self._snapshots[key]
+
     # Network communications
     # -----------------------------------------
-    def cifsServer(self, item_filter = None, item_id=None, item_name=None):
+    def cifsServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('cifsServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def dnsServer(self, item_filter = None, item_id=None, item_name=None):
+    def dnsServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('dnsServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fileDNSServer(self, item_filter = None, item_id=None, item_name=None):
+    def fileDNSServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fileDNSServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fileInterface(self, item_filter = None, item_id=None, item_name=None):
+    def fileInterface(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fileInterface',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fileKerberosServer(self, item_filter = None, item_id=None, item_name=None):
+    def fileKerberosServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fileKerberosServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fileLDAPServer(self, item_filter = None, item_id=None, item_name=None):
+    def fileLDAPServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fileLDAPServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fileNDMPServer(self, item_filter = None, item_id=None, item_name=None):
+    def fileNDMPServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fileNDMPServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fileNISServer(self, item_filter = None, item_id=None, item_name=None):
+    def fileNISServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fileNISServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def ftpServer(self, item_filter = None, item_id=None, item_name=None):
+    def ftpServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ftpServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def ipInterface(self, item_filter = None, item_id=None, item_name=None):
+    def ipInterface(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ipInterface',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def ipPort(self, item_filter = None, item_id=None, item_name=None):
+    def ipPort(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ipPort',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def iscsiNode(self, item_filter = None, item_id=None, item_name=None):
+    def iscsiNode(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('iscsiNode',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def iscsiPortal(self, item_filter = None, item_id=None, item_name=None):
+    def iscsiPortal(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('iscsiPortal',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def iscsiSettings(self, item_filter = None, item_id=None, item_name=None):
+    def iscsiSettings(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('iscsiSettings',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def linkAggregation(self, item_filter = None, item_id=None, item_name=None):
+    def linkAggregation(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('linkAggregation',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def mgmtInterface(self, item_filter = None, item_id=None, item_name=None):
+    def mgmtInterface(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('mgmtInterface',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def mgmtInterfaceSettings(self, item_filter = None, item_id=None, item_name=None):
+    def mgmtInterfaceSettings(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('mgmtInterfaceSettings',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def nasServer(self, item_filter = None, item_id=None, item_name=None):
+    def nasServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('nasServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def nfsServer(self, item_filter = None, item_id=None, item_name=None):
+    def nfsServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('nfsServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def preferredInterfaceSettings(self, item_filter = None, item_id=None, item_name=None):
+    def preferredInterfaceSettings(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('preferredInterfaceSettings',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def route(self, item_filter = None, item_id=None, item_name=None):
+    def route(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('route',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def smtpServer(self, item_filter = None, item_id=None, item_name=None):
+    def smtpServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('smtpServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def urServer(self, item_filter = None, item_id=None, item_name=None):
+    def urServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('urServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def virusChecker(self, item_filter = None, item_id=None, item_name=None):
+    def virusChecker(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('virusChecker',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def vmwareNasPEServer(self, item_filter = None, item_id=None, item_name=None):
+    def vmwareNasPEServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('vmwareNasPEServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Events and Alerts
     # -----------------------------------------
-    def alert(self, item_filter = None, item_id=None, item_name=None):
+    def alert(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('alert',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def alertConfig(self, item_filter = None, item_id=None, item_name=None):
+    def alertConfig(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('alertConfig',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def alertConfigSNMPTarget(self, item_filter = None, item_id=None, item_name=None):
+    def alertConfigSNMPTarget(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('alertConfigSNMPTarget',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def event(self, item_filter = None, item_id=None, item_name=None):
+    def event(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('event',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Jobs
     # -----------------------------------------
-    def job(self, item_filter = None, item_id=None, item_name=None):
+    def job(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('job',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Remote Systems
     # -----------------------------------------
-    def cifsShare(self, item_filter = None, item_id=None, item_name=None):
+    def cifsShare(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('cifsShare',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def datastore(self, item_filter = None, item_id=None, item_name=None):
+    def datastore(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('datastore',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def host(self, item_filter = None, item_id=None, item_name=None):
+    def host(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('host',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def hostContainer(self, item_filter = None, item_id=None, item_name=None):
+    def hostContainer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('hostContainer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def hostIPPort(self, item_filter = None, item_id=None, item_name=None):
+    def hostIPPort(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('hostIPPort',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def hostInitiator(self, item_filter = None, item_id=None, item_name=None):
+    def hostInitiator(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('hostInitiator',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def hostInitiatorPath(self, item_filter = None, item_id=None, item_name=None):
+    def hostInitiatorPath(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('hostInitiatorPath',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def hostLUN(self, item_filter = None, item_id=None, item_name=None):
+    def hostLUN(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('hostLUN',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def hostVVolDatastore(self, item_filter = None, item_id=None, item_name=None):
+    def hostVVolDatastore(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('hostVVolDatastore',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def nfsShare(self, item_filter = None, item_id=None, item_name=None):
+    def nfsShare(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('nfsShare',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def remoteSystem(self, item_filter = None, item_id=None, item_name=None):
+    def remoteSystem(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('remoteSYstem',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def rpChapSettings(self, item_filter = None, item_id=None, item_name=None):
+    def rpChapSettings(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('rpChapSettings',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def vm(self, item_filter = None, item_id=None, item_name=None):
+    def vm(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('vm',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def vmDisk(self, item_filter = None, item_id=None, item_name=None):
+    def vmDisk(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('vmDisk',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def vmwarePE(self, item_filter = None, item_id=None, item_name=None):
+    def vmwarePE(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('vmwarePE',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Storage Management
     # -----------------------------------------
-    def aclUser(self, item_filter = None, item_id=None, item_name=None):
+    def aclUser(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('aclUser',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def capabilityProfile(self, item_filter = None, item_id=None, item_name=None):
+    def capabilityProfile(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('capabilityProfile',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def dhsmServer(self, item_filter = None, item_id=None, item_name=None):
+    def dhsmServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('dhsmServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def diskGroup(self, item_filter = None, item_id=None, item_name=None):
+    def diskGroup(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('diskGroup',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fastCache(self, item_filter = None, item_id=None, item_name=None):
+    def fastCache(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fastCache',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fastVP(self, item_filter = None, item_id=None, item_name=None):
+    def fastVP(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fastVP',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def filesystem(self, item_filter = None, item_id=None, item_name=None):
+    def filesystem(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('filesystem',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def lun(self, item_filter = None, item_id=None, item_name=None):
+    def lun(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('lun',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def pool(self, item_filter = None, item_id=None, item_name=None):
+    def pool(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('pool',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def poolConsumer(self, item_filter = None, item_id=None, item_name=None):
+    def poolConsumer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('poolConsumer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def poolConsumerAllocation(self, item_filter = None, item_id=None, item_name=None):
+    def poolConsumerAllocation(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('poolConsumerAllocation',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def poolUnit(self, item_filter = None, item_id=None, item_name=None):
+    def poolUnit(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('poolUnit',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def quotaConfig(self, item_filter = None, item_id=None, item_name=None):
+    def quotaConfig(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('quotaConfig',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def raidGroup(self, item_filter = None, item_id=None, item_name=None):
+    def raidGroup(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('raidGroup',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def storageResource(self, item_filter = None, item_id=None, item_name=None):
+    def storageResource(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('storageResource',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def storageResourceCapabilityProfile(self, item_filter = None, item_id=None, item_name=None):
+    def storageResourceCapabilityProfile(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('storageResourceCapabilityProfile',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def storageTier(self, item_filter = None, item_id=None, item_name=None):
+    def storageTier(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('storageTier',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def treeQuota(self, item_filter = None, item_id=None, item_name=None):
+    def treeQuota(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('treeQuota',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def userQuota(self, item_filter = None, item_id=None, item_name=None):
+    def userQuota(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('userQuota',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def virtualVolume(self, item_filter = None, item_id=None, item_name=None):
+    def virtualVolume(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('virtualVolume',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Environment Management
     # -----------------------------------------
-    def battery(self, item_filter = None, item_id=None, item_name=None):
+    def battery(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('battery',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def dae(self, item_filter = None, item_id=None, item_name=None):
+    def dae(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('dae',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def disk(self, item_filter = None, item_id=None, item_name=None):
+    def disk(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('disk',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def dpe(self, item_filter = None, item_id=None, item_name=None):
+    def dpe(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('dpe',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def encryption(self, item_filter = None, item_id=None, item_name=None):
+    def encryption(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('encryption',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def ethernetPort(self, item_filter = None, item_id=None, item_name=None):
+    def ethernetPort(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ethernetPort',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fan(self, item_filter = None, item_id=None, item_name=None):
+    def fan(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fan',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def fcPort(self, item_filter = None, item_id=None, item_name=None):
+    def fcPort(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('fcPort',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def ioModule(self, item_filter = None, item_id=None, item_name=None):
+    def ioModule(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ioModule',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def lcc(self, item_filter = None, item_id=None, item_name=None):
+    def lcc(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('lcc',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def memoryModule(self, item_filter = None, item_id=None, item_name=None):
+    def memoryModule(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('memoryModule',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def powerSupply(self, item_filter = None, item_id=None, item_name=None):
+    def powerSupply(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('powerSupply',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def sasPort(self, item_filter = None, item_id=None, item_name=None):
+    def sasPort(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('sasPort',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def ssc(self, item_filter = None, item_id=None, item_name=None):
+    def ssc(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ssc',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def ssd(self, item_filter = None, item_id=None, item_name=None):
+    def ssd(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ssd',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def storageProcessor(self, item_filter = None, item_id=None, item_name=None):
+    def storageProcessor(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('storageProcessor',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def uncommittedPort(self, item_filter = None, item_id=None, item_name=None):
+    def uncommittedPort(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('uncommittedPort',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Managing the System
     # -----------------------------------------
-    def basicSystemInfo(self, item_filter = None, item_id=None, item_name=None):
+    def basicSystemInfo(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('basicSystemInfo',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def candidateSoftwareVersion(self, item_filter = None, item_id=None, item_name=None):
+    def candidateSoftwareVersion(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('candidateSoftwareVersion',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def feature(self, item_filter = None, item_id=None, item_name=None):
+    def feature(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('feature',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def installedSoftwareVersion(self, item_filter = None, item_id=None, item_name=None):
+    def installedSoftwareVersion(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('installedSoftwareVersion',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def license(self, item_filter = None, item_id=None, item_name=None):
+    def license(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('license',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
-    def ntpServer(self, item_filter = None, item_id=None, item_name=None):
+                               item_id=item_id, item_name=item_name, **kwargs)
+    def ntpServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ntpServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def remoteSyslog(self, item_filter = None, item_id=None, item_name=None):
+    def remoteSyslog(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('remoteSyslog',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def serviceContract(self, item_filter = None, item_id=None, item_name=None):
+    def serviceContract(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('serviceContract',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def softwareUpgradeSession(self, item_filter = None, item_id=None, item_name=None):
+    def softwareUpgradeSession(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('softwareUpgradeSession',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def system(self, item_filter = None, item_id=None, item_name=None):
+    def system(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('system',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def systemInformation(self, item_filter = None, item_id=None, item_name=None):
+    def systemInformation(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('systemInformation',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def systemLimit(self, item_filter = None, item_id=None, item_name=None):
+    def systemLimit(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('systemLimit',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def systemTime(self, item_filter = None, item_id=None, item_name=None):
+    def systemTime(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('systemTime',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Monitoring capacity and performance
     # -----------------------------------------
-    def metric(self, item_filter = None, item_id=None, item_name=None):
+    def metric(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('metric',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def metricCollection(self, item_filter = None, item_id=None, item_name=None):
+    def metricCollection(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('metricCollection',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def metricQueryResult(self, item_filter = None, item_id=None, item_name=None):
+    def metricQueryResult(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         """ metricQueryResult is an odd request, as it REQUIRES a specific filter
             to be passed to it.  For the user, we're taking that as either a part
-            of the filter, or we're creating the filter for them """
+            of the filter, or we're creating the filter for them from item_id,
+            the id of the metricRealTimeQuery """
 
-        if item_id:
-            if "queryId" not in item_filter:
-                if item_filter:
-                    item_filter = "queryId EQ %s && %s" % (item_id, item_filter)
-                else:
-                    item_filter = "queryId EQ %s" % item_id
+        if item_id and "queryId" not in (item_filter or ''):
+            item_filter = _and_filter("queryId EQ %s" % item_id, item_filter)
 
-        if "queryId" not in item_filter:
-            # TODO, we really should throw an exception here
-            return None
+        if "queryId" not in (item_filter or ''):
+            raise ValueError("metricQueryResult needs a queryId, pass the "
+                             "metricRealTimeQuery id as item_id")
 
+        # Results have no id of their own, they are always a collection
         return self.get_object('metricQueryResult',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_name=item_name, **kwargs)
 
-    def metricRealTimeQuery(self, item_filter = None, item_id=None, item_name=None):
+    def metricRealTimeQuery(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('metricRealTimeQuery',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def metricService(self, item_filter = None, item_id=None, item_name=None):
+    def metricService(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('metricService',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def metricValue(self, item_filter = None, item_id=None, item_name=None):
+    def metricValue(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('metricValue',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
+
+    def metric_stream(self, paths, interval = 5, renew_before = 60, typed = False):
+        """ A MetricStream yielding real-time samples of the metric paths
+            every interval seconds """
+        return MetricStream(self, paths, interval, renew_before, typed)
+
+    def metric_history(self, paths, start, end = None, interval = None, workers = 8,
+                       samples_per_window = 1000):
+        """ Historical metricValue samples of the metric paths between start
+            and end (datetimes, in UTC when naive, seconds since the epoch
+            or a timedelta before now), as {path: [samples, oldest first]}
+
+            Samples come from the metricCollection with the given interval,
+            or the finest one whose retention still covers start.  The
+            range is split into windows of samples_per_window intervals per
+            path, fetched by up to `workers` threads.  With a metric_store
+            only the ranges it doesn't hold yet are fetched.
+        """
+        now = time.time()
+        collection, paths, start, end, windows = _history_plan(
+            self.metricCollection(), paths, start, end, interval, samples_per_window, now,
+            self.metric_store, self.ip_addr)
+
+        def fetch(window):
+            path, window_start, window_end = window
+            return self.metricValue(item_filter = _history_filter(path, collection.interval,
+                                                                  window_start, window_end),
+                                    per_page = samples_per_window)
+
+        if workers > 1 and len(windows) > 1:
+            pool = _thread_pool(min(workers, len(windows)))
+            try:
+                results = pool.map(fetch, windows)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [fetch(window) for window in windows]
+
+        return _history_result(paths, windows, results, start, end, collection.interval, now,
+                               self.metric_store, self.ip_addr)
 
     # Protecting Data
     # -----------------------------------------
-    def ldapServer(self, item_filter = None, item_id=None, item_name=None):
+    def ldapServer(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ldapServer',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def remoteInterface(self, item_filter = None, item_id=None, item_name=None):
+    def remoteInterface(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('remoteInterface',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def replicationInterface(self, item_filter = None, item_id=None, item_name=None):
+    def replicationInterface(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('replicationInterface',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def replicationSession(self, item_filter = None, item_id=None, item_name=None):
+    def replicationSession(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('replicationSession',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def snap(self, item_filter = None, item_id=None, item_name=None):
+    def snap(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('snap',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def snapSchedule(self, item_filter = None, item_id=None, item_name=None):
+    def snapSchedule(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('snapSchedule',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Quality of Service
     # -----------------------------------------
-    def ioLimitPolicy(self, item_filter = None, item_id=None, item_name=None):
+    def ioLimitPolicy(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ioLimitPolicy',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def ioLimitRule(self, item_filter = None, item_id=None, item_name=None):
+    def ioLimitRule(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ioLimitRule',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def ioLimitSetting(self, item_filter = None, item_id=None, item_name=None):
+    def ioLimitSetting(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('ioLimitSetting',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Servicing the System
     # -----------------------------------------
-    def configCaptureResult(self, item_filter = None, item_id=None, item_name=None):
+    def configCaptureResult(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('configCaptureResult',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def dataCollectionResult(self, item_filter = None, item_id=None, item_name=None):
+    def dataCollectionResult(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('dataCollectionResult',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def esrsParam(self, item_filter = None, item_id=None, item_name=None):
+    def esrsParam(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('esrsParam',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def esrsPolicymanager(self, item_filter = None, item_id=None, item_name=None):
+    def esrsPolicymanager(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('esrsPolicymanager',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def serviceAction(self, item_filter = None, item_id=None, item_name=None):
+    def serviceAction(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('serviceAction',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def serviceInfo(self, item_filter = None, item_id=None, item_name=None):
+    def serviceInfo(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('serviceInfo',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def supportAsset(self, item_filter = None, item_id=None, item_name=None):
+    def supportAsset(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('supportAsset',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def supportService(self, item_filter = None, item_id=None, item_name=None):
+    def supportService(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('supportService',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def technicalAdvisory(self, item_filter = None, item_id=None, item_name=None):
+    def technicalAdvisory(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('technicalAdvisory',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Users and Security
     # -----------------------------------------
-    def crl(self, item_filter = None, item_id=None, item_name=None):
+    def crl(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('crl',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def loginSessionInfo(self, item_filter = None, item_id=None, item_name=None):
+    def loginSessionInfo(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('loginSessionInfo',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def role(self, item_filter = None, item_id=None, item_name=None):
+    def role(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('role',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def roleMapping(self, item_filter = None, item_id=None, item_name=None):
+    def roleMapping(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('roleMapping',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def securitySettings(self, item_filter = None, item_id=None, item_name=None):
+    def securitySettings(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('securitySettings',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def user(self, item_filter = None, item_id=None, item_name=None):
+    def user(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('user',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
-    def x509Certificate(self, item_filter = None, item_id=None, item_name=None):
+    def x509Certificate(self, item_filter = None, item_id=None, item_name=None, **kwargs):
         return self.get_object('x509Certificate',item_filter=item_filter,
-                               item_id=item_id, item_name=item_name)
+                               item_id=item_id, item_name=item_name, **kwargs)
 
     # Helper Functions
     # -----------------------------------------
     def delete_storageResource(self, lun_id):
         response = self.delete('/instances/storageResource/%s' % lun_id)
+        self.invalidate_cache(*_STORAGE_TYPES)
         return response
 
     def delete_lun(self, lun_id):
@@ -706,10 +1505,7 @@ class Unity:
                    'lunParameters':{'pool':{'id':pool_id},
                    'size':size}}
 
-        response = self.post('/types/storageResource/action/createLun',payload)
-
-        new_id = response.json()['content']['storageResource']['id']
-        return self.lun(item_id=new_id)
+        return self._create_storage_resource('createLun', payload)
 
     def create_lun_from_obj(self, lun_object):
         """ Creates a new block LUN based on a lun_object being passed """
@@ -717,21 +1513,15 @@ class Unity:
                    'lunParameters':{'pool':{'id':lun_object.pool},
                                     'size': lun_object.sizeTotal}}
 
-        response = self.post('/types/storageResource/action/createLun',payload)
-
-        new_id = response.json()['content']['storageResource']['id']
-        return self.lun(item_id=new_id)
+        return self._create_storage_resource('createLun', payload)
 
     def create_vmware_lun_from_obj(self, lun_object):
         """ Creates a new block LUN based on a lun_object being passed """
         payload = {'name': lun_object.name,
                    'lunParameters':{'pool':{'id':lun_object.pool},
                                     'size': lun_object.sizeTotal}}
-        print payload
-        response = self.post('/types/storageResource/action/createVmwareLun',payload)
-
-        new_id = response.json()['content']['storageResource']['id']
-        return self.lun(item_id=new_id)
+        print(payload)
+        return self._create_storage_resource('createVmwareLun', payload)
 
     def create_vmware_lun(self, lun_name, pool_id, size, lun_description=None):
         """ Creates a new block LUN in pool_id, returns a lun object """
@@ -739,7 +1529,12 @@ class Unity:
                    'lunParameters':{'pool':{'id':pool_id},
                    'size':size}}
 
-        response = self.post('/types/storageResource/action/createVmwareLun',payload)
+        return self._create_storage_resource('createVmwareLun', payload)
+
+    def _create_storage_resource(self, action, payload):
+        """ Run a storageResource create action, returns the new lun object """
+        response = self.post('/types/storageResource/action/%s' % action, payload)
+        self.invalidate_cache(*_STORAGE_TYPES)
 
         new_id = response.json()['content']['storageResource']['id']
         return self.lun(item_id=new_id)
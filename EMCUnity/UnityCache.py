@@ -0,0 +1,111 @@
+import threading
+import time
+from collections import OrderedDict
+
+# Seconds to keep results for each Unity type.  Hardware and system
+# information rarely changes, alerts and jobs change all the time and
+# performance data is never cached.  A TTL of 0 disables caching.
+DEFAULT_TTLS = {
+    'basicSystemInfo': 3600,
+    'battery': 600,
+    'dae': 600,
+    'disk': 600,
+    'dpe': 600,
+    'encryption': 600,
+    'ethernetPort': 600,
+    'fan': 600,
+    'fcPort': 600,
+    'feature': 600,
+    'installedSoftwareVersion': 600,
+    'ioModule': 600,
+    'lcc': 600,
+    'license': 600,
+    'memoryModule': 600,
+    'powerSupply': 600,
+    'sasPort': 600,
+    'ssc': 600,
+    'ssd': 600,
+    'storageProcessor': 600,
+    'system': 600,
+    'systemInformation': 600,
+    'systemLimit': 600,
+    'uncommittedPort': 600,
+    'alert': 5,
+    'event': 5,
+    'job': 5,
+    'loginSessionInfo': 0,
+    'metricQueryResult': 0,
+    'metricRealTimeQuery': 0,
+    'metricValue': 0,
+    'systemTime': 0,
+}
+
+_MISSING = object()
+
+
+class UnityCache(object):
+    """ In-memory LRU cache of get_object results with a TTL per Unity type
+
+        unity = Unity('unity.ktelep.local', 'admin', 'pw',
+                      cache=UnityCache(ttls={'pool': 60}, max_entries=500))
+    """
+
+    def __init__(self, ttls=None, default_ttl=30, max_entries=1024):
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl(self, unity_type):
+        """ Seconds a result of unity_type stays valid """
+        return self.ttls.get(unity_type, self.default_ttl)
+
+    def get(self, key, default=None):
+        """ Return the cached value for key, or default if it is missing or
+            expired.  Keys are tuples starting with the Unity type """
+        with self._lock:
+            entry = self._entries.pop(key, _MISSING)
+            if entry is _MISSING:
+                return default
+
+            expires, value = entry
+            if expires < time.time():
+                return default
+
+            # Re-insert to mark the key as most recently used
+            self._entries[key] = entry
+            return value
+
+    def set(self, key, value):
+        """ Cache value for the TTL of the key's Unity type """
+        ttl = self.ttl(key[0])
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *unity_types):
+        """ Drop cached results for the given types, or everything if no
+            type is given """
+        with self._lock:
+            if not unity_types:
+                self._entries.clear()
+                return
+
+            for key in list(self._entries):
+                if key[0] in unity_types:
+                    del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return "<Unity Cache: %d entries>" % len(self._entries)
@@ -0,0 +1,135 @@
+import json
+from array import array
+
+try:
+    integer_types = (int, long)
+except NameError:  # Python 3
+    integer_types = (int,)
+
+try:
+    string_types = basestring
+except NameError:  # Python 3
+    string_types = str
+
+# Python 2 has no 'q' typecode, 'l' is 64 bit on most platforms
+try:
+    _INT_CODE = 'q'
+    array(_INT_CODE)
+except ValueError:
+    _INT_CODE = 'l'
+_INT_MAX = 2 ** (array(_INT_CODE).itemsize * 8 - 1) - 1
+_INT_MIN = -_INT_MAX - 1
+
+
+class UnityResultSet(object):
+    """ Compact, column oriented collection of Unity objects
+
+        Values are stored per field instead of per object: fields that are
+        None for every row are stored once, integer and float columns are
+        packed into arrays, and equal strings and nested values (e.g.
+        {'id': 'pool_1'} references or health dicts) are shared between
+        rows.  Rows are rebuilt as the usual UnityClasses tuples on access:
+
+            luns = unity.lun(columnar=True)
+            luns[0]                    # Unitylun(id='sv_1', ...)
+            luns.column('sizeTotal')   # array('q', [...])
+
+        Shared nested values must not be modified in place.  Pass the same
+        strings dict to several result sets (e.g. across a fleet) to share
+        values between them too.
+    """
+
+    def __init__(self, object_type, columns, length):
+        self.object_type = object_type
+        self._columns = columns
+        self._length = length
+
+    @classmethod
+    def from_rows(cls, object_type, rows, strings=None):
+        """ Build a result set from an iterable of object_type tuples,
+            consuming it one row at a time """
+        builder = _ResultSetBuilder(object_type, strings, cls)
+        for row in rows:
+            builder.add(row)
+        return builder.build()
+
+    def column(self, name):
+        """ All values of one field, in row order """
+        column = self._columns[self.object_type._fields.index(name)]
+        if column is None:
+            return [None] * self._length
+        return column
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("UnityResultSet index out of range")
+
+        return tuple.__new__(self.object_type,
+                             [None if column is None else column[index]
+                              for column in self._columns])
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self[index]
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return "<Unity Result Set: %d %s>" % (self._length, self.object_type.__name__)
+
+
+class _ResultSetBuilder(object):
+    """ Fills the columns of a result set one row at a time, for rows that
+        don't come from a plain iterable (AsyncUnity's async generators) """
+
+    def __init__(self, object_type, strings=None, result_type=UnityResultSet):
+        self.object_type = object_type
+        self.strings = dict() if strings is None else strings
+        self.result_type = result_type
+        self._values = [[] for field in object_type._fields]
+        self._length = 0
+
+    def add(self, row):
+        for column, value in zip(self._values, row):
+            column.append(_share(value, self.strings))
+        self._length += 1
+
+    def build(self):
+        columns = tuple(_pack(column) for column in self._values)
+        return self.result_type(self.object_type, columns, self._length)
+
+
+def _share(value, strings):
+    """ Return an equal value already seen in this result set, if any """
+    if value is None or isinstance(value, (bool, float) + integer_types):
+        return value
+
+    if isinstance(value, string_types):
+        return strings.setdefault(value, value)
+
+    if isinstance(value, (dict, list)):
+        key = ('json', json.dumps(value, sort_keys=True))
+        return strings.setdefault(key, value)
+
+    return value
+
+
+def _pack(column):
+    """ Store a column as compactly as its values allow """
+    if all(value is None for value in column):
+        return None
+
+    if all(isinstance(value, integer_types) and not isinstance(value, bool)
+           and _INT_MIN <= value <= _INT_MAX for value in column):
+        return array(_INT_CODE, column)
+
+    if all(isinstance(value, float) for value in column):
+        return array('d', column)
+
+    return column
@@ -0,0 +1,368 @@
+"""
+Prometheus exporter for Unity performance metrics:
+
+    unity_exporter.py unity1.example.com unity2.example.com -u monitor
+
+serves the latest real-time samples of every array on
+http://<host>:9400/metrics.  The password is read from EMCUNITY_PASSWORD,
+or prompted for.
+"""
+from __future__ import print_function
+
+import argparse
+import getpass
+import os
+import re
+import sys
+import threading
+import time
+
+from .Unity import Unity
+from .UnityMetrics import COUNTER_WRAP, MetricStream, _flatten
+
+try:
+    number_types = (int, long, float)
+except NameError:  # Python 3
+    number_types = (int, float)
+
+__all__ = ['UnityCollector', 'UnityExporter', 'DEFAULT_PATHS']
+
+DEFAULT_PATHS = ['sp.*.cpu.summary.utilization',
+                 'sp.*.storage.lun.*.readsRate',
+                 'sp.*.storage.lun.*.writesRate',
+                 'sp.*.storage.lun.*.readBytesRate',
+                 'sp.*.storage.lun.*.writeBytesRate']
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_NAME_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+
+def _http_server():
+    """ The HTTP server modules, imported on first use as they are slow to
+        import and only the exporter needs them """
+    try:
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from socketserver import ThreadingMixIn
+    except ImportError:  # Python 2
+        from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+        from SocketServer import ThreadingMixIn
+    return BaseHTTPRequestHandler, HTTPServer, ThreadingMixIn
+
+def metric_name(path, prefix='unity'):
+    """ The Prometheus name of a metric path, without its wildcards:
+        'sp.*.storage.lun.*.readsRate' is unity_sp_storage_lun_readsRate """
+    parts = [prefix] + [part for part in path.split('.') if part != '*']
+    return _NAME_RE.sub('_', '_'.join(parts))
+
+def metric_labels(path):
+    """ A label name for each wildcard of a metric path, after the part
+        before it: 'sp.*.storage.lun.*.readsRate' gives ['sp', 'lun'] """
+    labels = []
+    parts = path.split('.')
+    for index, part in enumerate(parts):
+        if part != '*':
+            continue
+        label = _NAME_RE.sub('_', parts[index - 1]) if index and parts[index - 1] != '*' else 'object'
+        if label in labels or label == 'array':
+            label = '%s%d' % (label, len(labels))
+        labels.append(label)
+    return labels
+
+def _escape(value):
+    return ('%s' % value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_value(value):
+    if not isinstance(value, float):
+        return '%d' % value
+    if value != value:
+        return 'NaN'
+    if value in (float('inf'), float('-inf')):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(value)
+
+def _sample_lines(name, labels, array, values):
+    """ Exposition lines for the nested values of one sample """
+    lines = []
+    for keys, value in _flatten(values):
+        if not isinstance(value, number_types) or isinstance(value, bool):
+            continue
+        names = labels[:len(keys)] + ['object%d' % index for index in range(len(labels), len(keys))]
+        pairs = [('array', array)] + list(zip(names, keys))
+        lines.append('%s{%s} %s' % (name, ','.join('%s="%s"' % (label, _escape(key))
+                                                  for label, key in pairs),
+                                    _format_value(value)))
+    return lines
+
+
+class UnityCollector(object):
+    """ Keeps the latest real-time samples of one array
+
+        A background thread keeps a metricRealTimeQuery for the paths
+        alive, polls it every interval seconds and renders the newest
+        sample of each path to Prometheus exposition lines, so reading them
+        never touches the array.  Failures are retried with a backoff of up
+        to max_backoff seconds, replacing the query, while the last values
+        are kept and unity_exporter_up reports 0.  Give the Unity a timeout:
+        a poll that never returns never fails either.
+    """
+
+    def __init__(self, unity, paths=None, interval=5, renew_before=60, max_backoff=60):
+        self.unity = unity
+        self.paths = list(paths or DEFAULT_PATHS)
+        self.interval = interval
+        self.renew_before = renew_before
+        self.max_backoff = max_backoff
+
+        self.up = False
+        self.last_success = None
+        self.error = None
+        self.version = 0
+
+        self._latest = dict()
+        self._metrics = None
+        self._families = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._stream = None
+
+    def start(self):
+        """ Start collecting in a daemon thread """
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name='UnityCollector-%s' % self.unity.ip_addr)
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """ Stop collecting and delete the query on the array """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(self.interval + 30)
+            self._thread = None
+
+    def _run(self):
+        failures = 0
+        try:
+            while not self._stopped.is_set():
+                if self._stream is None:
+                    self._stream = MetricStream(self.unity, self.paths, self.interval, self.renew_before)
+                if self._stopped.wait(self._stream._wait()):
+                    break
+                try:
+                    self.collect()
+                    failures = 0
+                except Exception as e:
+                    failures += 1
+                    self._failed(e)
+                    self._stopped.wait(min(self.interval * 2 ** failures, self.max_backoff))
+        finally:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+
+    def _failed(self, error):
+        """ Keep the last values but report the array down, and replace the
+            query on the next attempt """
+        self.error = error
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.close()
+        with self._lock:
+            self.up = False
+            self._render()
+
+    def collect(self):
+        """ Poll the query once and render the new samples """
+        if self._stream is None:
+            self._stream = MetricStream(self.unity, self.paths, self.interval, self.renew_before)
+        if self._metrics is None:
+            self._metrics = self._load_metrics()
+        samples = self._stream.poll()
+
+        with self._lock:
+            for sample in samples:
+                self._latest[sample.path] = sample
+            self.up = True
+            self.last_success = time.time()
+            self.error = None
+            self._render()
+
+    def _load_metrics(self):
+        """ {path: metric} for the paths, to tell counters from gauges and
+            describe them.  Paths the array doesn't describe are gauges.
+            Failures are raised, to be retried with the next poll """
+        metrics = self.unity.metric(item_filter=' || '.join('path eq "%s"' % path for path in self.paths),
+                                    fields=['path', 'type', 'description'])
+        return dict((metric.path, metric) for metric in metrics or [])
+
+    def _render(self):
+        """ Rebuild the families: (name, type, help, lines) """
+        array = self.unity.ip_addr
+        families = [('unity_exporter_up', 'gauge', 'Whether the last poll of the array succeeded',
+                     ['unity_exporter_up{array="%s"} %d' % (_escape(array), self.up)])]
+        if self.last_success is not None:
+            families.append(('unity_exporter_last_success_timestamp_seconds', 'gauge',
+                             'When the array was last polled successfully',
+                             ['unity_exporter_last_success_timestamp_seconds{array="%s"} %.3f'
+                              % (_escape(array), self.last_success)]))
+
+        for path in self.paths:
+            sample = self._latest.get(path)
+            if sample is None:
+                continue
+            metric = (self._metrics or {}).get(path)
+            counter = metric is not None and metric.type in COUNTER_WRAP
+            name = metric_name(path) + ('_total' if counter else '')
+            description = getattr(metric, 'description', None) or path
+            families.append((name, 'counter' if counter else 'gauge', description,
+                             _sample_lines(name, metric_labels(path), array, sample.values)))
+
+        self._families = families
+        self.version += 1
+
+    def families(self):
+        """ The rendered (name, type, help, lines) families """
+        with self._lock:
+            return list(self._families)
+
+    def __repr__(self):
+        return "<Unity Collector: %s, %d paths every %ss>" % (self.unity.ip_addr, len(self.paths), self.interval)
+
+
+class UnityExporter(object):
+    """ Serves the samples of UnityCollectors on /metrics
+
+        The exposition is rebuilt only when a collector has new samples, so
+        a scrape costs the same however many Prometheus servers scrape and
+        however many arrays are collected:
+
+            exporter = UnityExporter([UnityCollector(unity1), UnityCollector(unity2)])
+            exporter.serve_forever()   # http://localhost:9400/metrics
+    """
+
+    def __init__(self, collectors, port=9400, address=''):
+        self.collectors = list(collectors)
+        self.port = port
+        self.address = address
+        self.server = None
+
+        self._versions = None
+        self._body = b''
+        self._lock = threading.Lock()
+
+    def render(self):
+        """ The current exposition, as bytes """
+        versions = [collector.version for collector in self.collectors]
+        with self._lock:
+            if versions != self._versions:
+                self._body = self._render()
+                self._versions = versions
+            return self._body
+
+    def _render(self):
+        # Each family is listed once, with the lines of every array
+        order = []
+        families = dict()
+        for collector in self.collectors:
+            for name, kind, description, lines in collector.families():
+                if name not in families:
+                    order.append(name)
+                    families[name] = (kind, description, [])
+                families[name][2].extend(lines)
+
+        output = []
+        for name in order:
+            kind, description, lines = families[name]
+            output.append('# HELP %s %s' % (name, description.replace('\\', '\\\\').replace('\n', '\\n')))
+            output.append('# TYPE %s %s' % (name, kind))
+            output.extend(lines)
+        return ('\n'.join(output) + '\n').encode('utf-8')
+
+    def start(self):
+        """ Start the collectors and the HTTP server, in daemon threads """
+        for collector in self.collectors:
+            collector.start()
+
+        BaseHTTPRequestHandler, HTTPServer, ThreadingMixIn = _http_server()
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] == '/metrics':
+                    self._send(200, CONTENT_TYPE, exporter.render())
+                elif self.path == '/':
+                    self._send(200, 'text/html', b'<html><body><a href="/metrics">Metrics</a></body></html>')
+                else:
+                    self._send(404, 'text/plain', b'Not found\n')
+
+            def _send(self, status, content_type, body):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+            allow_reuse_address = True
+
+        self.server = Server((self.address, self.port), Handler)
+        self.port = self.server.server_address[1]
+        thread = threading.Thread(target=self.server.serve_forever, name='UnityExporter')
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def serve_forever(self):
+        """ Start, if not started yet, and serve until interrupted """
+        if self.server is None:
+            self.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """ Stop the HTTP server and the collectors """
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        for collector in self.collectors:
+            collector.stop()
+
+    def __repr__(self):
+        return "<Unity Exporter: %d arrays on port %s>" % (len(self.collectors), self.port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export Unity performance metrics to Prometheus")
+    parser.add_argument('hosts', nargs='+', help="Unity arrays to collect from")
+    parser.add_argument('-u', '--user', default='admin', help="Username used for the arrays")
+    parser.add_argument('-m', '--metric', dest='paths', action='append',
+                        help="metric path to export, repeat for more (default: %s)" % ', '.join(DEFAULT_PATHS))
+    parser.add_argument('-i', '--interval', type=int, default=5, help="seconds between polls")
+    parser.add_argument('-t', '--timeout', type=float, default=30,
+                        help="seconds to wait for an array before reporting it down")
+    parser.add_argument('-l', '--listen', default=':9400', help="[address]:port to serve /metrics on")
+    args = parser.parse_args(argv)
+
+    password = os.environ.get('EMCUNITY_PASSWORD') or getpass.getpass()
+    address, _, port = args.listen.rpartition(':')
+
+    collectors = [UnityCollector(Unity(host, args.user, password, timeout=args.timeout, lazy=True),
+                                 args.paths, args.interval)
+                  for host in args.hosts]
+    exporter = UnityExporter(collectors, int(port), address).start()
+    print("Serving %d arrays on http://%s:%d/metrics" % (len(collectors), address or 'localhost', exporter.port),
+          file=sys.stderr)
+    exporter.serve_forever()
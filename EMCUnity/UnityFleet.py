@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import namedtuple
+
+try:
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
+
+from .Unity import Unity, _thread_pool
+
+FleetResult = namedtuple('FleetResult', ['unity', 'result', 'error', 'elapsed'])
+
+
+class FleetTimeout(Exception):
+    """ Reported as the error of an array that didn't answer within the
+        fleet timeout """
+    pass
+
+
+class UnityFleet(object):
+    """ A group of Unity arrays queried together
+
+        Any Unity accessor can be called on the fleet and runs against every
+        array in parallel, at most max_workers at a time:
+
+            fleet = UnityFleet([unity1, unity2, unity3], max_workers=32, timeout=30)
+            for res in fleet.imap('alert', item_filter='severity GE 4'):
+                print(res.unity.name, res.error or len(res.result))
+
+            pools = fleet.pool()   # {ip_addr: FleetResult}
+    """
+
+    def __init__(self, arrays=None, max_workers=16, timeout=None):
+        self.arrays = list(arrays or [])
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        # Worker threads shared by every query, see _get_pool
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @classmethod
+    def from_hosts(cls, hosts, username, password, max_workers=16, timeout=None, **kwargs):
+        """ Build a fleet of lazy Unity clients, one per host.  Nothing is
+            sent to the arrays until the fleet is first queried; extra
+            keyword arguments are passed on to Unity.  Each request times
+            out after the fleet timeout unless Unity's timeout is given """
+        kwargs.setdefault('lazy', True)
+        kwargs.setdefault('timeout', timeout)
+        arrays = [Unity(host, username, password, **kwargs) for host in hosts]
+        return cls(arrays, max_workers=max_workers, timeout=timeout)
+
+    def add(self, unity):
+        """ Add a Unity instance to the fleet """
+        self.arrays.append(unity)
+
+    def imap(self, accessor, *args, **kwargs):
+        """
+        Call accessor (a Unity method name, or a function taking a Unity
+        instance) on every array, yielding a FleetResult for each array as
+        it completes.  Exceptions are returned in FleetResult.error rather
+        than raised; arrays that run past the fleet timeout are reported
+        with a FleetTimeout error and their late results discarded.
+        """
+
+        arrays = list(self.arrays)
+        if not arrays:
+            return
+
+        if callable(accessor):
+            call = lambda unity: accessor(unity, *args, **kwargs)
+        else:
+            call = lambda unity: getattr(unity, accessor)(*args, **kwargs)
+
+        results = queue.Queue()
+        started = {}
+
+        def run(index):
+            started[index] = time.time()
+            try:
+                result, error = call(arrays[index]), None
+            except Exception as e:
+                result, error = None, e
+            results.put((index, result, error, time.time() - started[index]))
+
+        pool = self._get_pool()
+        for index in range(len(arrays)):
+            pool.apply_async(run, (index,))
+
+        # Arrays past the timeout are reported without waiting for them,
+        # their workers are free again once their requests time out
+        pending = set(range(len(arrays)))
+        while pending:
+            try:
+                index, result, error, elapsed = results.get(timeout=self._wait(pending, started))
+            except queue.Empty:
+                for index in self._expired(pending, started):
+                    pending.discard(index)
+                    error = FleetTimeout("%s did not answer within %ss" % (arrays[index], self.timeout))
+                    yield FleetResult(arrays[index], None, error, time.time() - started[index])
+                continue
+
+            if index in pending:
+                pending.discard(index)
+                yield FleetResult(arrays[index], result, error, elapsed)
+
+    def map(self, accessor, *args, **kwargs):
+        """ Like imap, but waits for every array and returns a dict of
+            FleetResults keyed by the array's ip_addr """
+        return dict((res.unity.ip_addr, res) for res in self.imap(accessor, *args, **kwargs))
+
+    def _get_pool(self):
+        """ The fleet's max_workers threads, started on first use and reused
+            by every query, so polling a hung array doesn't leak threads """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = _thread_pool(self.max_workers)
+            return self._pool
+
+    def shutdown(self):
+        """ Stop the fleet's worker threads, without waiting for arrays
+            that are still answering """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+
+    def _wait(self, pending, started):
+        """ Seconds until the next running array hits the timeout """
+        if self.timeout is None:
+            return None
+
+        now = time.time()
+        deadlines = [started[index] + self.timeout for index in pending if index in started]
+        if len(deadlines) < len(pending):
+            # Some arrays are still queued behind the worker limit
+            deadlines.append(now + min(self.timeout, 1.0))
+        return max(min(deadlines) - now, 0.01)
+
+    def _expired(self, pending, started):
+        now = time.time()
+        return [index for index in sorted(pending)
+                if index in started and now - started[index] >= self.timeout]
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not callable(getattr(Unity, name, None)):
+            raise AttributeError(name)
+
+        def fleet_call(*args, **kwargs):
+            return self.map(name, *args, **kwargs)
+        fleet_call.__name__ = name
+        return fleet_call
+
+    def __len__(self):
+        return len(self.arrays)
+
+    def __iter__(self):
+        return iter(self.arrays)
+
+    def __repr__(self):
+        return "<Unity Fleet: %d arrays>" % len(self.arrays)
@@ -0,0 +1,369 @@
+import errno
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+
+from . import UnityClasses
+from .UnityMetrics import _epoch, _seconds, _timestamp
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    _replace = os.replace
+except AttributeError:  # Python 2, whose rename can't replace a file on Windows
+    _replace = os.rename
+
+try:
+    number_types = (int, long, float)
+except NameError:  # Python 3
+    number_types = (int, float)
+
+# One value of one object at one time: milliseconds since the epoch, the
+# object's column and the value.  Files are plain arrays of these, e.g.
+# numpy.memmap(file, dtype=[('t', '<i8'), ('column', '<i4'), ('value', '<f8')])
+RECORD = struct.Struct('<qid')
+_TIMESTAMP = struct.Struct('<q')
+
+
+class _Series(object):
+    """ A file of RECORDs in timestamp order """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def _count(self, series_file):
+        return os.fstat(series_file.fileno()).st_size // RECORD.size
+
+    def _lower_bound(self, data, count, ms):
+        """ Index of the first record at or after ms """
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if _TIMESTAMP.unpack_from(data, middle * RECORD.size)[0] < ms:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _map(self, series_file, count):
+        return mmap.mmap(series_file.fileno(), count * RECORD.size, access=mmap.ACCESS_READ)
+
+    def read(self, start_ms=None, end_ms=None):
+        """ (timestamp, column, value) records with start_ms <= timestamp < end_ms """
+        try:
+            series_file = open(self.filename, 'rb')
+        except IOError:
+            return []
+
+        with series_file:
+            count = self._count(series_file)
+            if not count:
+                return []
+
+            data = self._map(series_file, count)
+            try:
+                first = 0 if start_ms is None else self._lower_bound(data, count, start_ms)
+                last = count if end_ms is None else self._lower_bound(data, count, end_ms)
+                return [RECORD.unpack_from(data, index * RECORD.size) for index in range(first, last)]
+            finally:
+                data.close()
+
+    def replace(self, start_ms, end_ms, records):
+        """ Replace the records in [start_ms, end_ms) with records (sorted,
+            all in that range).  New data after the end of the file, the
+            usual case, is appended; older data rewrites the file """
+        packed = b''.join(RECORD.pack(*record) for record in records)
+
+        try:
+            series_file = open(self.filename, 'r+b')
+        except IOError:
+            series_file = open(self.filename, 'w+b')
+
+        with series_file:
+            count = self._count(series_file)
+            if not count:
+                series_file.write(packed)
+                return
+
+            data = self._map(series_file, count)
+            try:
+                first = self._lower_bound(data, count, start_ms)
+                last = self._lower_bound(data, count, end_ms)
+                if last < count:
+                    before, after = data[:first * RECORD.size], data[last * RECORD.size:]
+            finally:
+                data.close()
+
+            if last == count:
+                series_file.seek(first * RECORD.size)
+                series_file.truncate()
+                series_file.write(packed)
+                return
+
+        temp_name = '%s.%d.tmp' % (self.filename, os.getpid())
+        with open(temp_name, 'wb') as temp_file:
+            temp_file.write(before + packed + after)
+        _replace(temp_name, self.filename)
+
+
+class _FileLock(object):
+    """ A lock on a file held across processes: shared for readers,
+        exclusive for writers (always exclusive on Windows) """
+
+    def __init__(self, filename, shared=False):
+        self.filename = filename
+        self.shared = shared
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.filename, 'a+b')
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except (IOError, OSError):
+                    continue   # LK_LOCK gives up after 10 seconds
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if fcntl is None:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+
+def _add_range(ranges, start, end):
+    """ ranges ([start, end] pairs) with start-end added, merged """
+    merged = []
+    for range_start, range_end in sorted(ranges + [[start, end]]):
+        if merged and range_start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], range_end)
+        else:
+            merged.append([range_start, range_end])
+    return merged
+
+def _sample_ms(timestamp):
+    """ Milliseconds since the epoch of a sample's timestamp """
+    if hasattr(timestamp, 'utctimetuple'):
+        seconds = _seconds(timestamp, 0)
+    else:
+        seconds = _epoch(timestamp)
+    return None if seconds is None else int(round(seconds * 1000))
+
+def _leaves(values, prefix=()):
+    """ (key list, value) for the numeric leaves of nested metric values """
+    if isinstance(values, dict):
+        for key, value in values.items():
+            for leaf in _leaves(value, prefix + (key,)):
+                yield leaf
+    elif isinstance(values, number_types) and not isinstance(values, bool):
+        yield list(prefix), float(values)
+
+def _nest(leaves):
+    """ Nested metric values from (key list, value) leaves """
+    values = dict()
+    for keys, value in leaves:
+        if not keys:
+            return value
+        level = values
+        for key in keys[:-1]:
+            level = level.setdefault(key, dict())
+        level[keys[-1]] = value
+    return values
+
+
+class UnityMetricStore(object):
+    """ Keeps metric samples on disk, per array and metric path
+
+        metric_history() and metric streams of a Unity created with
+        metric_store= write their samples through to the store, and
+        metric_history() then only asks the array for the time ranges
+        the store doesn't hold yet:
+
+            store = UnityMetricStore()
+            unity = Unity('unity.ktelep.local', 'admin', 'pw', metric_store=store)
+            unity.metric_history(paths, timedelta(days=7))   # fetches 7 days
+            unity.metric_history(paths, timedelta(days=7))   # fetches what's new
+
+        Samples are kept in append-only files of fixed size records (see
+        RECORD) that are read through mmap.  Rollups to each of the rollups
+        intervals (seconds) longer than the samples' are kept alongside:
+        the mean of each period, or its last value for the paths listed in
+        counters.  Read them with read(..., resolution=3600).
+    """
+
+    def __init__(self, path=None, rollups=(60, 300, 3600), counters=()):
+        if path is None:
+            path = os.path.join(os.path.expanduser('~'), '.emcunity', 'metrics')
+        self.path = path
+        self.rollups = tuple(rollups)
+        self.counters = set(counters)
+        self._lock = threading.RLock()
+
+    def _directory(self, array):
+        directory = os.path.join(self.path, re.sub(r'[^A-Za-z0-9_.-]', '_', array))
+        try:
+            os.makedirs(directory, 0o700)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        return directory
+
+    def _key(self, path):
+        return hashlib.sha1(path.encode('utf-8')).hexdigest()
+
+    def series_file(self, array, path, interval, resolution=None):
+        """ The file holding the samples of path taken every interval
+            seconds, or their rollup to resolution seconds """
+        name = '%s.%g' % (self._key(path), interval)
+        if resolution and resolution != interval:
+            name += '.r%g' % resolution
+        return os.path.join(self._directory(array), name + '.dat')
+
+    def _locked(self, array, path, shared=False):
+        """ A lock on path's files, between processes """
+        return _FileLock(os.path.join(self._directory(array), '%s.lock' % self._key(path)), shared)
+
+    def _load_meta(self, array, path):
+        """ The columns (object keys) and covered ranges of a path, read
+            from disk every time as other processes may have added to them """
+        meta_name = os.path.join(self._directory(array), '%s.json' % self._key(path))
+        try:
+            with open(meta_name) as meta_file:
+                meta = json.load(meta_file)
+        except (IOError, OSError, ValueError):
+            meta = {'path': path, 'columns': [], 'covered': {}}
+        meta['index'] = dict((tuple(keys), column) for column, keys in enumerate(meta['columns']))
+        return meta
+
+    def _save_meta(self, array, path, meta):
+        meta_name = os.path.join(self._directory(array), '%s.json' % self._key(path))
+        temp_name = '%s.%d.tmp' % (meta_name, os.getpid())
+        with open(temp_name, 'w') as meta_file:
+            json.dump(dict((k, v) for k, v in meta.items() if k != 'index'), meta_file)
+        _replace(temp_name, meta_name)
+
+    def write(self, array, path, interval, samples, covered=None):
+        """ Store samples of path taken every interval seconds.  covered
+            ((start, end) in seconds) marks that range as read from the
+            array, even where it had no samples """
+        with self._lock, self._locked(array, path):
+            meta = self._load_meta(array, path)
+            index = meta['index']
+
+            values = dict()
+            for sample in samples:
+                ms = _sample_ms(sample.timestamp)
+                if ms is None:
+                    continue
+                for keys, value in _leaves(sample.values):
+                    column = index.get(tuple(keys))
+                    if column is None:
+                        column = index[tuple(keys)] = len(meta['columns'])
+                        meta['columns'].append(keys)
+                    values[ms, column] = value
+            # Samples repeated at window edges are stored once
+            records = sorted((ms, column, value) for (ms, column), value in values.items())
+
+            start_ms = end_ms = None
+            if records:
+                start_ms, end_ms = records[0][0], records[-1][0] + 1
+            if covered is not None and covered[1] > covered[0]:
+                ranges = meta['covered'].get('%g' % interval, [])
+                meta['covered']['%g' % interval] = _add_range(ranges, covered[0], covered[1])
+                covered_ms = int(covered[0] * 1000), int(covered[1] * 1000)
+                start_ms = covered_ms[0] if start_ms is None else min(start_ms, covered_ms[0])
+                end_ms = covered_ms[1] if end_ms is None else max(end_ms, covered_ms[1])
+            if start_ms is None:
+                return
+
+            # Samples read again replace the ones stored for the same range
+            _Series(self.series_file(array, path, interval)).replace(start_ms, end_ms, records)
+            self._roll_up(array, path, interval, start_ms, end_ms - 1)
+            self._save_meta(array, path, meta)
+
+    def _roll_up(self, array, path, interval, first_ms, last_ms):
+        """ Recompute the rollup periods touched by samples in first-last """
+        raw = _Series(self.series_file(array, path, interval))
+        counter = path in self.counters
+
+        for resolution in self.rollups:
+            if resolution <= interval:
+                continue
+            step = resolution * 1000
+            start_ms = first_ms // step * step
+            end_ms = last_ms // step * step + step
+
+            periods = dict()
+            for ms, column, value in raw.read(start_ms, end_ms):
+                period = periods.setdefault((ms // step * step, column), [0.0, 0, None])
+                period[0] += value
+                period[1] += 1
+                period[2] = value
+
+            records = sorted((key[0], key[1], last if counter else total / count)
+                             for key, (total, count, last) in periods.items())
+            _Series(self.series_file(array, path, interval, resolution)).replace(start_ms, end_ms, records)
+
+    def missing(self, array, path, interval, start, end):
+        """ (start, end) ranges, in seconds, of path's interval samples
+            between start and end that haven't been read from the array """
+        with self._locked(array, path, shared=True):
+            covered = self._load_meta(array, path)['covered'].get('%g' % interval, [])
+
+        gaps = []
+        for covered_start, covered_end in covered:
+            if covered_end <= start:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > start:
+                gaps.append((start, covered_start))
+            start = max(start, covered_end)
+        if start < end:
+            gaps.append((start, end))
+        return gaps
+
+    def read(self, array, path, start=None, end=None, interval=60, resolution=None):
+        """ Stored samples of path between start and end (as for
+            Unity.metric_history), oldest first, as UnitymetricValue.  With
+            resolution the samples are the rollups to that many seconds """
+        now = time.time()
+        start_ms = None if start is None else int(_seconds(start, now) * 1000)
+        end_ms = None if end is None else int(_seconds(end, now) * 1000)
+
+        with self._locked(array, path, shared=True):
+            columns = self._load_meta(array, path)['columns']
+            records = _Series(self.series_file(array, path, interval, resolution)).read(start_ms, end_ms)
+
+        samples = []
+        sample_interval = resolution or interval
+        position = 0
+        while position < len(records):
+            ms = records[position][0]
+            leaves = []
+            while position < len(records) and records[position][0] == ms:
+                leaves.append((columns[records[position][1]], records[position][2]))
+                position += 1
+            samples.append(UnityClasses.UnitymetricValue(path, _timestamp(ms / 1000.0),
+                                                         sample_interval, _nest(leaves)))
+        return samples
+
+    def __repr__(self):
+        return "<Unity Metric Store: %s>" % self.path
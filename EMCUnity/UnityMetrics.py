@@ -0,0 +1,422 @@
+import calendar
+import datetime
+import email.utils
+import time
+from collections import namedtuple
+
+import requests
+
+from .UnityTyped import parse_timestamp
+
+try:
+    string_types = basestring
+except NameError:  # Python 3
+    string_types = str
+
+
+# Values of wrapping counters, by metric type (MetricTypeEnum): 32 and 64
+# bit counters and virtual counters
+COUNTER_WRAP = {2: 2 ** 32, 3: 2 ** 64, 7: 2 ** 32, 8: 2 ** 64}
+
+MetricArray = namedtuple('MetricArray', ['path', 'timestamps', 'objects', 'values'])
+
+
+def _numpy():
+    """ numpy, imported on first use as it is optional and slow to import """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("metric_arrays requires the numpy module")
+    return numpy
+
+def _epoch(timestamp):
+    """ Seconds since the epoch of a Unity timestamp, or None """
+    parsed = parse_timestamp(timestamp)
+    if parsed is None:
+        return None
+    return calendar.timegm(parsed.utctimetuple()) + parsed.microsecond / 1e6
+
+def _seconds(moment, now):
+    """ Seconds since the epoch of a datetime (naive ones are UTC), a
+        timedelta before now or a number of seconds """
+    if moment is None:
+        return now
+    if isinstance(moment, datetime.timedelta):
+        return now - (moment.days * 86400 + moment.seconds + moment.microseconds / 1e6)
+    if isinstance(moment, datetime.datetime):
+        return calendar.timegm(moment.utctimetuple()) + moment.microsecond / 1e6
+    return float(moment)
+
+def _timestamp(seconds):
+    """ A Unity timestamp for seconds since the epoch """
+    moment = datetime.datetime.utcfromtimestamp(int(seconds))
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+class _MetricQuery(object):
+    """ Bookkeeping shared by MetricStream and AsyncMetricStream: the
+        current real-time query, when to renew it and which samples have
+        already been returned """
+
+    def __init__(self, paths, interval=5, renew_before=60):
+        if isinstance(paths, string_types):
+            paths = paths.split(',')
+        self.paths = [path.strip() for path in paths if path.strip()]
+        self.interval = interval
+        self.renew_before = renew_before
+
+        self.query_id = None
+        self.expires = None
+        self.closed = False
+        self._last = dict()
+        self._next_poll = 0
+
+    def _payload(self):
+        return {'paths': self.paths, 'interval': self.interval}
+
+    def _set_query(self, content, array_time=None):
+        """ Keep the query created by the array.  Its expiration is measured
+            against the array's clock (array_time, from the Date header)
+            when known, so the local clock may be off """
+        self.query_id = content['id']
+        self.expires = None
+
+        expiration = _epoch(content.get('expiration'))
+        if expiration is not None:
+            if array_time is None:
+                array_time = time.time()
+            self.expires = time.time() + expiration - array_time
+
+    def _needs_query(self):
+        return (self.query_id is None or
+                (self.expires is not None and time.time() >= self.expires - self.renew_before))
+
+    def _new_samples(self, results):
+        """ Results newer than the last sample returned for their path, in
+            timestamp order """
+        samples = []
+        for result in results or []:
+            last = self._last.get(result.path)
+            if last is None or result.timestamp > last:
+                samples.append(result)
+
+        samples.sort(key=lambda result: result.timestamp)
+        for result in samples:
+            self._last[result.path] = result.timestamp
+        return samples
+
+    def _store(self, samples):
+        """ Write samples through to the Unity's metric store, if any """
+        store = getattr(self.unity, 'metric_store', None)
+        if store is not None and samples:
+            by_path = dict()
+            for sample in samples:
+                by_path.setdefault(sample.path, []).append(sample)
+            for path, path_samples in by_path.items():
+                store.write(self.unity.ip_addr, path, self.interval, path_samples)
+        return samples
+
+    def _wait(self):
+        """ Seconds to wait before the next poll, scheduling the one after """
+        now = time.time()
+        delay = max(0, self._next_poll - now)
+        self._next_poll = max(now, self._next_poll) + self.interval
+        return delay
+
+
+class MetricStream(_MetricQuery):
+    """ Real-time metric samples from a Unity array
+
+        Creates a metricRealTimeQuery for the metric paths, polls its
+        results every interval seconds and yields each new
+        UnitymetricQueryResult once, oldest first.  The query is replaced
+        renew_before seconds before it expires and deleted when the stream
+        is closed:
+
+            with unity.metric_stream(['sp.*.cpu.summary.utilization'], interval=10) as stream:
+                for sample in stream:
+                    print sample.timestamp, sample.values
+    """
+
+    def __init__(self, unity, paths, interval=5, renew_before=60, typed=False):
+        super(MetricStream, self).__init__(paths, interval, renew_before)
+        self.unity = unity
+        self.typed = typed
+
+    def __iter__(self):
+        try:
+            while not self.closed:
+                time.sleep(self._wait())
+                for sample in self.poll():
+                    yield sample
+        finally:
+            self.close()
+
+    def poll(self):
+        """ New samples since the last poll, without waiting """
+        if self._needs_query():
+            self._create_query()
+        results = self.unity.metricQueryResult(item_id=self.query_id, typed=self.typed)
+        return self._store(self._new_samples(results))
+
+    def _create_query(self):
+        old_query = self.query_id
+        response = self.unity.post('/types/metricRealTimeQuery/instances', self._payload())
+
+        array_time = None
+        date = email.utils.parsedate_tz(response.headers.get('Date') or '')
+        if date is not None:
+            array_time = email.utils.mktime_tz(date)
+
+        self._set_query(response.json()['content'], array_time)
+        if self.expires is None:
+            self._set_query(self.unity.get('/instances/metricRealTimeQuery/%s' % self.query_id,
+                                           {'fields': 'id,expiration'}).json()['content'],
+                            array_time)
+
+        if old_query is not None:
+            self._delete_query(old_query)
+
+    def _delete_query(self, query_id):
+        """ Delete a query on the array, it expires by itself if that fails """
+        try:
+            self.unity.delete('/instances/metricRealTimeQuery/%s' % query_id)
+        except requests.exceptions.RequestException:
+            pass
+
+    def close(self):
+        """ Stop the stream and delete its query """
+        self.closed = True
+        if self.query_id is not None:
+            query_id, self.query_id = self.query_id, None
+            self._delete_query(query_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return "<Unity Metric Stream: %d paths every %ss>" % (len(self.paths), self.interval)
+
+
+def _flatten(values, prefix=()):
+    """ Yield (key tuple, value) for the leaves of nested metric values,
+        e.g. {'spa': {'sv_1': 12}} gives (('spa', 'sv_1'), 12) """
+    if isinstance(values, dict):
+        for key, value in values.items():
+            for item in _flatten(value, prefix + (key,)):
+                yield item
+    else:
+        yield prefix, values
+
+def _datetime64(timestamp):
+    """ A timestamp string or datetime as a naive UTC string numpy parses """
+    if isinstance(timestamp, datetime.datetime):
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.replace(tzinfo=None) - timestamp.utcoffset()
+        return timestamp.isoformat()
+    return timestamp.rstrip('Z')
+
+def metric_arrays(samples, counter=False, wrap=None, interval=None):
+    """
+    Turn metricValue or metricQueryResult samples into dense NumPy arrays,
+    returning a MetricArray per path:
+
+        timestamps  datetime64[ms] array, one per sample
+        objects     key tuples of the columns, e.g. ('spa', 'sv_1')
+        values      float array of timestamps x objects, NaN where the
+                    array reported no value
+
+    counter=True turns cumulative counters into per second rates, over the
+    time since the previous sample (the first row is NaN).  A counter that
+    went down has wrapped around `wrap` (see COUNTER_WRAP) or, without
+    wrap, was reset and gives NaN.  Rates of 64 bit counters lose
+    precision once values exceed 2**53.
+
+    interval (seconds) places the rows on a regular grid aligned to the
+    interval, so series from different paths or arrays line up; missing
+    samples are NaN rows.
+    """
+    np = _numpy()
+
+    by_path = dict()
+    for sample in samples:
+        by_path.setdefault(sample.path, []).append(sample)
+
+    arrays = dict()
+    for path, path_samples in by_path.items():
+        arrays[path] = _metric_array(np, path, path_samples, counter, wrap, interval)
+    return arrays
+
+def _metric_array(np, path, samples, counter, wrap, interval):
+    timestamps = np.array([_datetime64(sample.timestamp) for sample in samples],
+                          dtype='datetime64[ms]')
+
+    # Columns in the order objects first appear.  Samples mostly repeat
+    # the objects of the previous one, so the columns of each per-SP dict
+    # are reused while its keys don't change
+    columns = dict()
+    known = dict()
+    pieces = []
+    for index, sample in enumerate(samples):
+        for top, nested in (sample.values or {}).items():
+            cached = known.get(top)
+            if isinstance(nested, dict) and (cached is None or cached[0] != list(nested)):
+                cached = known[top] = None
+                if not any(isinstance(value, dict) for value in nested.values()):
+                    keys = list(nested)
+                    cached = known[top] = (keys, np.array([columns.setdefault((top, key), len(columns))
+                                                           for key in keys], dtype=np.intp))
+
+            if isinstance(nested, dict) and cached is not None:
+                pieces.append((index, cached[1], list(nested.values())))
+            else:
+                flat = list(_flatten(nested, (top,)))
+                pieces.append((index, [columns.setdefault(key, len(columns)) for key, value in flat],
+                               [value for key, value in flat]))
+
+    values = np.full((len(samples), len(columns)), np.nan)
+    for index, keys, row in pieces:
+        values[index, keys] = row
+
+    # Sort by time, keeping the last sample of a repeated timestamp
+    order = np.argsort(timestamps, kind='stable')
+    timestamps, values = timestamps[order], values[order]
+    if len(timestamps):
+        last = np.append(timestamps[1:] != timestamps[:-1], True)
+        timestamps, values = timestamps[last], values[last]
+
+    if counter:
+        values = _rates(np, timestamps, values, wrap)
+
+    if interval:
+        timestamps, values = _regular(np, timestamps, values, interval)
+
+    objects = sorted(columns, key=columns.get)
+    return MetricArray(path, timestamps, objects, values)
+
+def _rates(np, timestamps, values, wrap):
+    """ Per second rates of counters, each value compared with the last
+        one reported for the same object so a missed sample doesn't leave
+        a gap """
+    rates = np.full(values.shape, np.nan)
+    if len(timestamps) < 2:
+        return rates
+
+    # Row of the last value of each column up to every row, -1 before any
+    rows = np.arange(len(timestamps))[:, None]
+    previous = np.where(np.isnan(values), -1, rows)
+    np.maximum.accumulate(previous, axis=0, out=previous)
+    previous = previous[:-1]
+
+    columns = np.arange(values.shape[1])[None, :]
+    earlier = np.maximum(previous, 0)
+    milliseconds = timestamps.astype('int64')
+    seconds = (milliseconds[1:, None] - milliseconds[earlier]) / 1000.0
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        deltas = values[1:] - values[earlier, columns]
+        wrapped = deltas < 0
+        if wrap:
+            deltas[wrapped] += wrap
+        else:
+            deltas[wrapped] = np.nan
+        deltas[previous < 0] = np.nan
+        rates[1:] = deltas / seconds
+    return rates
+
+def _regular(np, timestamps, values, interval):
+    """ Rows placed on a grid of interval seconds """
+    step = np.timedelta64(int(interval * 1000), 'ms')
+    if not len(timestamps):
+        return timestamps, values
+
+    start = timestamps[0] - (timestamps[0] - np.datetime64(0, 'ms')) % step
+    slots = ((timestamps - start) // step).astype(int)
+
+    grid = start + step * np.arange(slots[-1] + 1)
+    regular = np.full((len(grid), values.shape[1]), np.nan)
+    regular[slots] = values
+    return grid, regular
+
+
+def _history_collection(collections, start, now, interval=None):
+    """ The metricCollection to read history from: the one with the given
+        interval, else the finest one still holding data from start """
+    collections = sorted(collections, key=lambda collection: collection.interval)
+    if not collections:
+        raise ValueError("The array has no metric collections")
+
+    if interval is not None:
+        for collection in collections:
+            if collection.interval == interval:
+                return collection
+        raise ValueError("No metric collection with a %ss interval" % interval)
+
+    for collection in collections:
+        if collection.retention is None or now - collection.retention <= start:
+            return collection
+    return collections[-1]
+
+def _history_windows(paths, start, end, step):
+    """ (path, window start, window end) for every path and window """
+    windows = []
+    while start < end:
+        windows.append((start, min(start + step, end)))
+        start += step
+    return [(path, window_start, window_end)
+            for path in paths for window_start, window_end in windows]
+
+def _history_filter(path, interval, start, end):
+    return ('path EQ "%s" && interval EQ %d && timestamp GE "%s" && timestamp LT "%s"'
+            % (path, interval, _timestamp(start), _timestamp(end)))
+
+def _history_plan(collections, paths, start, end, interval, samples_per_window, now,
+                  store=None, array=None):
+    """ The collection, paths, range and (path, start, end) windows of a
+        backfill.  With a store, windows only cover what it is missing """
+    if isinstance(paths, string_types):
+        paths = paths.split(',')
+    paths = [path.strip() for path in paths if path.strip()]
+
+    start, end = _seconds(start, now), _seconds(end, now)
+    collection = _history_collection(collections, start, now, interval)
+
+    # Nothing older than the collection's oldest sample is kept
+    oldest = _epoch(collection.oldest)
+    if oldest is not None:
+        start = max(start, oldest)
+
+    step = collection.interval * samples_per_window
+    if store is None:
+        windows = _history_windows(paths, start, end, step)
+    else:
+        windows = [window for path in paths
+                   for gap_start, gap_end in store.missing(array, path, collection.interval, start, end)
+                   for window in _history_windows([path], gap_start, gap_end, step)]
+    return collection, paths, start, end, windows
+
+def _history_result(paths, windows, results, start, end, interval, now, store=None, array=None):
+    """ The merged series of each path, read back from the store after
+        writing the new windows to it when there is one """
+    if store is None:
+        return _merge_history(paths, windows, results)
+
+    for (path, window_start, window_end), samples in zip(windows, results):
+        # The latest interval may still gain samples, read it again next time
+        store.write(array, path, interval, samples or [],
+                    covered=(window_start, min(window_end, now - interval)))
+    return dict((path, store.read(array, path, start, end, interval)) for path in paths)
+
+def _merge_history(paths, windows, results):
+    """ One time ordered series per path from the results of each window,
+        dropping samples repeated at window edges """
+    history = dict((path, dict()) for path in paths)
+    for (path, window_start, window_end), samples in zip(windows, results):
+        for sample in samples or []:
+            history[sample.path if sample.path in history else path][sample.timestamp] = sample
+
+    return dict((path, [samples[timestamp] for timestamp in sorted(samples)])
+                for path, samples in history.items())
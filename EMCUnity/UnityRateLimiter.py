@@ -0,0 +1,94 @@
+import threading
+import time
+
+# The status reported for a request that got no response at all
+_FAILED = object()
+
+
+class RateLimiter(object):
+    """ Adaptive token bucket limiting the requests sent to one array
+
+        At most `rate` requests a second (with bursts of up to `burst`) and
+        `max_inflight` concurrent requests are allowed.  The rate adapts to
+        the array: it is halved when the array answers 429/503, doesn't
+        answer at all or answers slower than target_latency, and creeps
+        back up towards max_rate while responses are fast, settling where
+        the SP keeps up.  With rate None only concurrent requests are
+        limited.
+    """
+
+    def __init__(self, rate=10.0, max_inflight=4, burst=None, min_rate=0.5,
+                 max_rate=None, target_latency=2.0, increase=0.1):
+        self.rate = None if rate is None else float(rate)
+        self.max_inflight = max_inflight
+        self.burst = burst or max(1.0, self.rate or 1.0)
+        self.min_rate = min_rate
+        self.max_rate = max_rate or self.rate
+        self.target_latency = target_latency
+        self.increase = increase
+
+        self.inflight = 0
+        self._tokens = self.burst
+        self._refilled = time.time()
+        self._last_decrease = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """ Block until a request may be sent """
+        with self._cond:
+            while True:
+                wait = self._take()
+                if wait == 0:
+                    return
+                self._cond.wait(wait)
+
+    def try_acquire(self):
+        """ Take a slot without blocking.  Returns 0 when a request may be
+            sent, else the seconds to wait before trying again, or None to
+            wait for a request in flight to finish """
+        with self._cond:
+            return self._take()
+
+    def _take(self):
+        if self.rate is not None:
+            self._refill()
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+        if self.max_inflight and self.inflight >= self.max_inflight:
+            return None
+
+        if self.rate is not None:
+            self._tokens -= 1
+        self.inflight += 1
+        return 0
+
+    def release(self, latency, status=None):
+        """ Record a finished request and adapt the rate to how the array
+            coped with it.  status is the HTTP status, or _FAILED when the
+            request got no response (refused, reset, timed out...) """
+        with self._cond:
+            self.inflight -= 1
+            if self.rate is not None:
+                self._adapt(latency, status)
+            self._cond.notify_all()
+
+    def _adapt(self, latency, status):
+        now = time.time()
+        if status is _FAILED or status in (429, 503) or latency > self.target_latency:
+            # Back off at most once per second, many requests in
+            # flight will report the same overload
+            if now - self._last_decrease >= 1.0:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._last_decrease = now
+        elif status is None or status < 500:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def _refill(self):
+        now = time.time()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def __repr__(self):
+        if self.rate is None:
+            return "<Unity Rate Limiter: %d in flight>" % self.inflight
+        return "<Unity Rate Limiter: %.1f req/s, %d in flight>" % (self.rate, self.inflight)
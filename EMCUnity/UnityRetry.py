@@ -0,0 +1,123 @@
+import email.utils
+import random
+import threading
+import time
+
+import requests
+
+
+class CircuitOpen(requests.exceptions.ConnectionError):
+    """ Raised without contacting the array while its circuit breaker is open """
+    pass
+
+
+class RetryPolicy(object):
+    """ When and how long to wait before retrying a failed request
+
+        Idempotent methods are retried on connection errors, timeouts,
+        responses cut off mid-body and the given HTTP statuses, waiting an
+        exponentially growing, jittered delay or the Retry-After the array
+        asked for.  One policy can be shared by many Unity instances.
+    """
+
+    def __init__(self, retries=3, backoff=0.5, backoff_max=30,
+                 methods=('GET', 'DELETE'), statuses=(429, 502, 503, 504)):
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.methods = methods
+        self.statuses = statuses
+
+    def should_retry(self, method, attempt, status=None):
+        """ Whether attempt (0 based) of method may be retried after a
+            connection error (status None) or an HTTP error status """
+        if attempt >= self.retries or method not in self.methods:
+            return False
+        return status is None or status in self.statuses
+
+    def delay(self, attempt, response=None):
+        """ Seconds to wait before the next attempt """
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+
+        # "Full jitter" keeps many clients from retrying in lock step
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt))
+
+    def __repr__(self):
+        return "<Unity Retry Policy: %d retries>" % self.retries
+
+
+def _retry_after(response):
+    """ The Retry-After of a response in seconds, or None """
+    if response is None:
+        return None
+
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        parsed = email.utils.parsedate_tz(value)
+        if parsed is None:
+            return None
+        return max(email.utils.mktime_tz(parsed) - time.time(), 0)
+
+
+class CircuitBreaker(object):
+    """ Fails fast once an array is clearly down
+
+        After failure_threshold consecutive failures the breaker opens and
+        requests raise CircuitOpen immediately.  Once reset_timeout seconds
+        have passed a single trial request is let through; it closes the
+        breaker if it succeeds and re-opens it if it fails.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened is not None
+
+    def before_request(self, name=''):
+        """ Raise CircuitOpen unless a request may be sent.  Returns True
+            for the trial request, which must be followed by end_trial() """
+        with self._lock:
+            if self.opened is None:
+                return False
+
+            if not self._trial and time.time() - self.opened >= self.reset_timeout:
+                self._trial = True
+                return True
+
+        raise CircuitOpen("Circuit open for %s after %d failures" % (name, self.failures))
+
+    def end_trial(self):
+        """ Let another trial through if this one ended without
+            success() or failure() being recorded """
+        with self._lock:
+            self._trial = False
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened = None
+            self._trial = False
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                self.opened = time.time()
+                self._trial = False
+
+    def __repr__(self):
+        return "<Unity Circuit Breaker: %s>" % ('open' if self.is_open else 'closed')
@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+
+_SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schemas')
+
+
+def _version_key(version):
+    """ Sortable form of an API version such as '4.2' or '5.0.1' """
+    key = []
+    for part in str(version).split('.'):
+        try:
+            key.append(int(part))
+        except ValueError:
+            key.append(0)
+    return tuple(key)
+
+
+class UnitySchema(object):
+    """ The REST API types of one Unity OE release
+
+        Built from the API reference by scripts/extract_obj_from_docs.py.
+        types maps each type name ('lun', 'pool'...) to its fields, in
+        documented order, as dicts:
+
+            {'name': 'pool', 'type': 'pool', 'ref': 'pool'}
+            {'name': 'health', 'type': 'health', 'embedded': 'health'}
+            {'name': 'tieringPolicy', 'type': 'TieringPolicyEnum', 'enum': 'TieringPolicyEnum'}
+            {'name': 'creationTime', 'type': 'DateTime'}
+
+        'list': True marks lists of the type, and 'expensive': True fields
+        the array has to compute for every instance.  enums maps each enum
+        name to its {NAME: value} members.
+    """
+
+    def __init__(self, api_version, types, enums=None):
+        self.api_version = api_version
+        self.types = types
+        self.enums = enums or dict()
+        self._supported = dict()
+        self._field_maps = dict()
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path) as schema_file:
+            schema = json.load(schema_file)
+        return cls(schema['apiVersion'], schema['types'], schema.get('enums'))
+
+    def save(self, path):
+        with open(path, 'w') as schema_file:
+            json.dump({'apiVersion': self.api_version,
+                       'types': self.types,
+                       'enums': self.enums},
+                      schema_file, indent=1, sort_keys=True)
+
+    def fields(self, type_name):
+        """ Names of the fields of type_name, or None if it isn't known """
+        if type_name not in self.types:
+            return None
+        return [field['name'] for field in self.types[type_name]['fields']]
+
+    def field(self, type_name, name):
+        """ The definition of one field of type_name, or None """
+        field_map = self._field_maps.get(type_name)
+        if field_map is None:
+            if type_name not in self.types:
+                return None
+            field_map = dict((field['name'], field) for field in self.types[type_name]['fields'])
+            self._field_maps[type_name] = field_map
+        return field_map.get(name)
+
+    def expensive(self, type_name):
+        """ Names of the fields of type_name flagged as expensive """
+        return [field['name'] for field in self.types.get(type_name, {}).get('fields', [])
+                if field.get('expensive')]
+
+    def enum(self, name):
+        """ {NAME: value} members of an enum, or None """
+        return self.enums.get(name)
+
+    def supported_fields(self, object_type):
+        """ The fields of an UnityClasses type this release supports, in
+            the type's order, or all of them if the type isn't known """
+        try:
+            return self._supported[object_type]
+        except KeyError:
+            pass
+
+        known = self.fields(object_type.__name__[len('Unity'):])
+        if known is None:
+            supported = list(object_type._fields)
+        else:
+            known = set(known)
+            supported = [field for field in object_type._fields if field in known]
+
+        self._supported[object_type] = supported
+        return supported
+
+    def __repr__(self):
+        return "<Unity Schema: API %s, %d types>" % (self.api_version, len(self.types))
+
+
+class UnitySchemaRegistry(object):
+    """ Schema files (<apiVersion>.json) in a directory, by API version
+
+        get() returns the schema of the array's release, or of the newest
+        older release when there is no exact match: fields only ever get
+        added between releases.  Arrays older than every schema get None
+        and use the UnityClasses field lists.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or _SCHEMA_DIR
+        self._versions = None
+        self._schemas = dict()
+        self._lock = threading.Lock()
+
+    def versions(self):
+        """ API versions with a schema file, oldest first """
+        if self._versions is None:
+            try:
+                names = os.listdir(self.path)
+            except OSError:
+                names = []
+            self._versions = sorted((name[:-len('.json')] for name in names
+                                     if name.endswith('.json')), key=_version_key)
+        return self._versions
+
+    def get(self, api_version):
+        """ The UnitySchema for an array reporting api_version, or None """
+        if api_version is None:
+            return None
+
+        candidates = [version for version in self.versions()
+                      if _version_key(version) <= _version_key(api_version)]
+        if not candidates:
+            return None
+
+        version = candidates[-1]
+        with self._lock:
+            if version not in self._schemas:
+                self._schemas[version] = UnitySchema.from_file(
+                    os.path.join(self.path, '%s.json' % version))
+            return self._schemas[version]
+
+    def __repr__(self):
+        return "<Unity Schema Registry: %s>" % self.path
+
+
+_default_registry = UnitySchemaRegistry()
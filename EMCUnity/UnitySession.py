@@ -0,0 +1,81 @@
+import errno
+import hashlib
+import json
+import os
+import time
+
+try:
+    _replace = os.replace
+except AttributeError:  # Python 2, whose rename can't replace a file on Windows
+    _replace = os.rename
+
+
+class UnitySessionStore(object):
+    """ Keeps Unity login sessions (cookies and CSRF token) on disk
+
+        Short lived scripts that share a store reuse the array's login
+        session instead of authenticating again on every run:
+
+            store = UnitySessionStore()
+            unity = Unity('unity.ktelep.local', 'admin', 'pw', session_store=store)
+
+        Sessions are stored one file per array and user, readable only by
+        the owner, and are dropped once they are older than max_age.
+    """
+
+    def __init__(self, path=None, max_age=3600):
+        if path is None:
+            path = os.path.join(os.path.expanduser('~'), '.emcunity', 'sessions')
+        self.path = path
+        self.max_age = max_age
+
+    def _file(self, ip_addr, username):
+        key = hashlib.sha1(('%s|%s' % (ip_addr, username)).encode('utf-8')).hexdigest()
+        return os.path.join(self.path, '%s.json' % key)
+
+    def load(self, ip_addr, username):
+        """ Returns the stored {'cookies', 'csrf_token'} for the array, or
+            None if there is no session or it has expired """
+        try:
+            with open(self._file(ip_addr, username)) as session_file:
+                session = json.load(session_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if session.get('saved', 0) + self.max_age < time.time():
+            self.discard(ip_addr, username)
+            return None
+
+        return session
+
+    def save(self, ip_addr, username, cookies, csrf_token):
+        """ Store the session cookies (a dict) and CSRF token for the array """
+        try:
+            os.makedirs(self.path, 0o700)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+        session = {'ip_addr': ip_addr,
+                   'username': username,
+                   'cookies': cookies,
+                   'csrf_token': csrf_token,
+                   'saved': time.time()}
+
+        # Write to a private temp file and rename it over the old session
+        session_path = self._file(ip_addr, username)
+        temp_path = '%s.%d.tmp' % (session_path, os.getpid())
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as session_file:
+            json.dump(session, session_file)
+        _replace(temp_path, session_path)
+
+    def discard(self, ip_addr, username):
+        """ Forget the stored session for the array """
+        try:
+            os.remove(self._file(ip_addr, username))
+        except OSError:
+            pass
+
+    def __repr__(self):
+        return "<Unity Session Store: %s>" % self.path
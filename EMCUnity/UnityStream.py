@@ -0,0 +1,109 @@
+import codecs
+import json
+
+_WHITESPACE = ' \t\n\r'
+_decoder = json.JSONDecoder()
+
+
+class _StreamBuffer(object):
+    """ Text read incrementally from an iterable of byte chunks """
+
+    def __init__(self, chunks, encoding='utf-8'):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.text = u''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """ Append the next chunk, dropping what has already been parsed """
+        if self.eof:
+            raise ValueError("Unexpected end of JSON stream")
+
+        try:
+            chunk = self.decoder.decode(next(self.chunks))
+        except StopIteration:
+            chunk = self.decoder.decode(b'', True)
+            self.eof = True
+
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self):
+        """ The next non-whitespace character, without consuming it """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            self.fill()
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError("Expected %r at %r" % (char, self.text[self.pos:self.pos + 20]))
+        self.pos += 1
+
+    def next_separator(self, close):
+        """ Consume ',' (returns True) or the closing character (False) """
+        char = self.peek()
+        self.pos += 1
+        if char == close:
+            return False
+        if char != ',':
+            raise ValueError("Expected ',' or %r, got %r" % (close, char))
+        return True
+
+    def value(self):
+        """ Decode the next complete JSON value """
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except ValueError:
+                self.fill()
+                continue
+
+            # A number that ends with the buffer may continue in the next chunk
+            if end == len(self.text) and not self.eof:
+                self.fill()
+                continue
+
+            self.pos = end
+            return value
+
+
+def iter_entries(chunks, meta=None):
+    """
+    Incrementally parse a Unity collection response from an iterable of
+    byte chunks (e.g. response.iter_content()), yielding each element of
+    'entries' as soon as it has been read.  Only one entry is held in
+    memory at a time.  The other top level keys ('links', 'entryCount',
+    or 'content' for a single instance) are stored in meta.
+    """
+
+    if meta is None:
+        meta = dict()
+
+    stream = _StreamBuffer(chunks)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+
+    while True:
+        key = stream.value()
+        stream.expect(':')
+
+        if key == 'entries':
+            stream.expect('[')
+            if stream.peek() == ']':
+                stream.pos += 1
+            else:
+                while True:
+                    yield stream.value()
+                    if not stream.next_separator(']'):
+                        break
+        else:
+            meta[key] = stream.value()
+
+        if not stream.next_separator('}'):
+            return
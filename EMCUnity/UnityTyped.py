@@ -0,0 +1,241 @@
+import datetime
+import re
+
+from . import UnityClasses
+
+try:
+    UTC = datetime.timezone.utc
+except AttributeError:  # Python 2
+    class _UTC(datetime.tzinfo):
+        def utcoffset(self, dt):
+            return datetime.timedelta(0)
+
+        def tzname(self, dt):
+            return 'UTC'
+
+        def dst(self, dt):
+            return datetime.timedelta(0)
+
+        def __repr__(self):
+            return 'UTC'
+
+    UTC = _UTC()
+
+try:
+    string_types = basestring
+except NameError:  # Python 3
+    string_types = str
+
+_TIMESTAMP_RE = re.compile(r'^(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6})\d*)?Z$')
+
+
+def parse_timestamp(value):
+    """ A UTC datetime from a Unity timestamp ('2017-04-06T16:14:13.000Z'),
+        or None if value isn't one """
+    if not isinstance(value, string_types):
+        return None
+    match = _TIMESTAMP_RE.match(value)
+    if match is None:
+        return None
+
+    parts = match.groups()
+    microsecond = int((parts[6] or '0').ljust(6, '0'))
+    return datetime.datetime(*[int(part) for part in parts[:6]], microsecond=microsecond, tzinfo=UTC)
+
+
+class UnityEnum(int):
+    """ An enum value from the array: still the int it was sent as (in
+        filters, comparisons and JSON) but with the member's name """
+    __slots__ = ()
+    _names = {}
+
+    @property
+    def name(self):
+        return self._names.get(int(self))
+
+    def __repr__(self):
+        return "%s.%s" % (type(self).__name__, self.name)
+
+    __str__ = int.__repr__
+
+_enum_types = dict()
+
+def enum_type(name, members):
+    """ The UnityEnum subclass for an enum with {NAME: value} members, with
+        each member as a class attribute (TieringPolicyEnum.Autotier) """
+    key = (name, tuple(sorted(members.items())))
+    if key not in _enum_types:
+        cls = type(str(name), (UnityEnum,), {'__slots__': (),
+                                             '_names': dict((v, k) for k, v in members.items())})
+        for member, value in members.items():
+            if not hasattr(cls, member):
+                setattr(cls, member, cls(value))
+        _enum_types[key] = cls
+    return _enum_types[key]
+
+
+def _has_type(type_name):
+    return 'Unity%s' % type_name in UnityClasses._SCHEMA
+
+def _named_type(field_name):
+    """ The type a field is named after ('pool', 'health', 'hostLUNs'), or None """
+    for candidate in (field_name, field_name[:-1]):
+        if candidate and _has_type(candidate):
+            return candidate
+    return None
+
+def _field_type(type_name, field_name, schema=None):
+    """ The type a field of type_name refers to or embeds, from the schema
+        or else from the field's name, or None """
+    spec = schema.field(type_name, field_name) if schema is not None else None
+    if spec is not None:
+        nested = spec.get('ref') or spec.get('embedded')
+        if nested and _has_type(nested):
+            return nested
+    return _named_type(field_name)
+
+def _object_decoder(type_name, schema):
+    """ Decodes a nested dict (a reference or an embedded type) into a
+        typed instance of Unity<type_name> """
+    def decode(value):
+        if not isinstance(value, dict):
+            return value
+        T = typed_type(getattr(UnityClasses, 'Unity%s' % type_name), schema)
+        return UnityClasses.content_constructor(T)(value)
+    return decode
+
+def _enum_decoder(cls):
+    def decode(value):
+        if isinstance(value, int) and not isinstance(value, bool) and value in cls._names:
+            return cls(value)
+        return value
+    return decode
+
+def _timestamp_decoder(value):
+    decoded = parse_timestamp(value)
+    return value if decoded is None else decoded
+
+def _list_decoder(decode):
+    def decode_list(value):
+        if not isinstance(value, list):
+            return decode(value)
+        return [decode(item) for item in value]
+    return decode_list
+
+def _nested_decoder(T):
+    """ Builds T from a nested dict, or from each dict of a list """
+    def decode(value):
+        if not isinstance(value, dict):
+            return value
+        return UnityClasses.content_constructor(T)(value)
+    return _list_decoder(decode)
+
+def _guess_decoder(field_name, schema):
+    """ Without a schema: timestamps by their format, nested dicts when a
+        type is named like the field ('pool', 'health', 'hostLUNs') """
+    type_name = _named_type(field_name)
+    decode_object = _object_decoder(type_name, schema) if type_name else None
+
+    def decode(value):
+        if isinstance(value, string_types):
+            return _timestamp_decoder(value)
+        if decode_object is not None and isinstance(value, (dict, list)):
+            return _list_decoder(decode_object)(value)
+        return value
+    return decode
+
+def _field_decoder(type_name, field_name, schema):
+    """ How a field of type_name is decoded, or None to leave it raw """
+    spec = None
+    if schema is not None and type_name in schema.types:
+        spec = schema.field(type_name, field_name)
+        if spec is None:
+            return None
+
+    if spec is None:
+        return _guess_decoder(field_name, schema)
+
+    kind = spec.get('type', '')
+    if kind.lower() == 'datetime':
+        decode = _timestamp_decoder
+    elif spec.get('enum') and schema.enum(spec['enum']):
+        decode = _enum_decoder(enum_type(spec['enum'], schema.enum(spec['enum'])))
+    elif _has_type(spec.get('ref') or spec.get('embedded') or ''):
+        decode = _object_decoder(spec.get('ref') or spec.get('embedded'), schema)
+    else:
+        return None
+
+    if spec.get('list'):
+        decode = _list_decoder(decode)
+    return decode
+
+def _lazy_field(index, decode):
+    """ A property decoding the raw value at index when it is read.  The
+        result isn't kept: typed instances have no __dict__, so they take
+        no more memory than plain ones """
+    getitem = tuple.__getitem__
+
+    def get(self):
+        return decode(getitem(self, index))
+
+    return property(get, doc="Alias for field number %d, decoded" % index)
+
+_typed_types = dict()
+
+def typed_type(object_type, schema=None):
+    """ A subclass of a UnityClasses type whose fields decode timestamps
+        to datetimes, enums to UnityEnum and references and embedded types
+        to typed instances, when they are read
+
+        Instances are built exactly like object_type's, so listing costs
+        nothing extra: indexing, iteration and _asdict() still give the
+        raw values.  A schema says which fields to decode, without one
+        timestamps are recognised by their format and nested dicts by the
+        field name.
+    """
+    key = (object_type, schema)
+    try:
+        return _typed_types[key]
+    except KeyError:
+        pass
+
+    type_name = object_type.__name__[len('Unity'):]
+    nested = getattr(object_type, '_nested', {})
+    # Projections pickle themselves, full types by the UnityClasses name
+    reduce = object_type.__dict__.get('__reduce__') or (lambda self: (object_type, tuple(self)))
+    namespace = {'__doc__': object_type.__doc__,
+                 '__module__': object_type.__module__,
+                 '__slots__': (),
+                 '__reduce__': reduce}
+    for index, field in enumerate(object_type._fields):
+        if field in nested:
+            decode = _nested_decoder(typed_type(nested[field], schema))
+        else:
+            decode = _field_decoder(type_name, field, schema)
+        if decode is not None:
+            namespace[field] = _lazy_field(index, decode)
+
+    T = type(object_type.__name__, (object_type,), namespace)
+    _typed_types[key] = T
+    return T
+
+def nested_type(object_type, nested):
+    """ A subclass of object_type whose fields in nested ({field: type})
+        build that type from the nested dicts the array returns for
+        dotted fields ('pool.name'), when they are read """
+    namespace = {'__doc__': object_type.__doc__,
+                 '__module__': object_type.__module__,
+                 '__slots__': (),
+                 '__reduce__': lambda self: (object_type, tuple(self)),
+                 '_nested': nested}
+    for field, T in nested.items():
+        index = object_type._fields.index(field)
+        namespace[field] = _lazy_field(index, _nested_decoder(T))
+
+    def __repr__(self):
+        return '%s(%s)' % (object_type.__name__,
+                           ', '.join('%s=%r' % (field, getattr(self, field))
+                                     for field in object_type._fields))
+    namespace['__repr__'] = __repr__
+
+    return type(object_type.__name__, (object_type,), namespace)
@@ -1,2 +1,43 @@
+import importlib
+import sys
+
+from . import UnityClasses
 from .Unity import *
-from .UnityClasses import *
+from .UnityCache import *
+from .UnityColumns import *
+from .UnityMetrics import *
+from .UnityRetry import *
+from .UnityRateLimiter import *
+from .UnitySchema import *
+from .UnityTyped import *
+
+# Modules loaded on first use of one of their names, as most scripts never
+# need them and some are slow to import (AsyncUnity imports aiohttp)
+_LAZY_NAMES = {'UnityExporter': ('UnityCollector', 'UnityExporter', 'DEFAULT_PATHS'),
+               'UnityFleet': ('FleetResult', 'FleetTimeout', 'UnityFleet'),
+               'UnityMetricStore': ('RECORD', 'UnityMetricStore'),
+               'UnitySession': ('UnitySessionStore',)}
+if sys.version_info >= (3, 6):
+    _LAZY_NAMES['AsyncUnity'] = ('AsyncUnity', 'AsyncMetricStream')
+
+def _load(module_name):
+    module = importlib.import_module('.' + module_name, __name__)
+    for name in _LAZY_NAMES[module_name]:
+        globals()[name] = getattr(module, name)
+
+# The Unity* types are created on first use, see UnityClasses
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        for module_name, names in _LAZY_NAMES.items():
+            if name in names:
+                _load(module_name)
+                return globals()[name]
+        return getattr(UnityClasses, name)
+else:
+    for _module_name in _LAZY_NAMES:
+        _load(_module_name)
+    from .UnityClasses import *
+
+__all__ = sorted(set(name for name in globals() if not name.startswith('_'))
+                 | set(UnityClasses.__all__)
+                 | set(name for names in _LAZY_NAMES.values() for name in names))
@@ -1,28 +1,151 @@
-from BeautifulSoup import BeautifulSoup
+"""
+Builds the schema of one Unity OE release from the HTML pages of its
+REST API Reference Guide (one page per type, e.g. lun.html):
+
+    python extract_obj_from_docs.py <docs dir> <apiVersion>
+
+writes ../schemas/<apiVersion>.json, which Unity picks for arrays
+reporting that apiVersion.  --classes prints the entries for the _SCHEMA
+dict in UnityClasses instead.
+"""
+from __future__ import print_function
+
+import argparse
 import glob
+import os
+import re
+import sys
+
+try:
+    from bs4 import BeautifulSoup
+
+    def parse(page):
+        return BeautifulSoup(page, 'html.parser')
+except ImportError:
+    from BeautifulSoup import BeautifulSoup as parse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from EMCUnity.UnitySchema import UnitySchema
+
+_LIST_RE = re.compile(r'^List\s*<\s*(.+?)\s*>$', re.I)
+
+# Values the array sends as-is, everything else is an enum, a reference
+# to another resource or an embedded type
+_PLAIN_TYPES = set(['string', 'integer', 'unsigned integer', 'int', 'long',
+                    'float', 'double', 'boolean', 'bool', 'datetime', 'date',
+                    'ipaddress', 'object'])
+
+# Descriptions of attributes the array works out for every instance it
+# returns.  A heuristic: review the flagged fields after each build.
+_EXPENSIVE_RE = re.compile(r'\b(calculat|comput|estimat|aggregat|statistic)', re.I)
+
+
+def read_table(file):
+    """ The rows of the first table of a page, as lists of cell texts,
+        without the header row """
+    soup = parse(open(file))
+
+    rows = []
+    table = soup.table
+    if table:
+        for row in table('tr'):
+            cells = [cell.text.strip() for cell in row('td')]
+            if not cells or cells[0] in ('Attribute', 'Name', 'Value'):
+                continue
+            rows.append(cells)
+    return rows
+
+
+def build_schema(docs_dir, api_version):
+    pages = dict((os.path.basename(file)[:-len('.html')], read_table(file))
+                 for file in glob.glob(os.path.join(docs_dir, '*.html')))
+
+    enums = dict()
+    attributes = dict()
+    for name, rows in pages.items():
+        if name.endswith('Enum'):
+            enums[name] = enum_members(rows)
+        else:
+            attributes[name] = rows
+
+    # Types with an id are resources of their own, the others are embedded
+    resources = set(name for name, rows in attributes.items()
+                    if any(row[0] == 'id' for row in rows))
+
+    types = dict()
+    for name, rows in attributes.items():
+        types[name] = {'fields': [field_spec(row, enums, resources) for row in rows]}
+
+    return UnitySchema(api_version, types, enums)
+
+
+def enum_members(rows):
+    """ {NAME: value} from Name | Value rows """
+    members = dict()
+    for row in rows:
+        if len(row) < 2:
+            continue
+        try:
+            members[row[0]] = int(row[1])
+        except ValueError:
+            members[row[0]] = row[1]
+    return members
+
+
+def field_spec(row, enums, resources):
+    """ The schema entry for an attribute | type | description row """
+    field = {'name': row[0]}
+    type_name = row[1] if len(row) > 1 else 'String'
+    description = row[2] if len(row) > 2 else ''
+
+    match = _LIST_RE.match(type_name)
+    if match:
+        type_name = match.group(1)
+        field['list'] = True
+    field['type'] = type_name
+
+    if type_name in enums or type_name.endswith('Enum'):
+        field['enum'] = type_name
+    elif type_name.lower() not in _PLAIN_TYPES:
+        field['ref' if type_name in resources else 'embedded'] = type_name
+
+    if _EXPENSIVE_RE.search(description):
+        field['expensive'] = True
+
+    return field
+
+
+def print_classes(schema):
+    """ Entries for the _SCHEMA dict in UnityClasses """
+    for name in sorted(schema.types):
+        print("    'Unity%s': [" % name)
+        for field in schema.fields(name):
+            print("        '%s'," % field)
+        print("    ],")
+
 
-object_files = glob.glob("*.html")
+def main():
+    parser = argparse.ArgumentParser(description="Build a Unity API schema from the reference guide")
+    parser.add_argument('docs_dir', help="directory holding one HTML page per type")
+    parser.add_argument('api_version', help="apiVersion reported by arrays running this release")
+    parser.add_argument('-o', '--output', help="schema directory (default: EMCUnity/schemas)")
+    parser.add_argument('--classes', action='store_true', help="print UnityClasses entries instead")
+    args = parser.parse_args()
 
-for file in object_files:
-    soup = BeautifulSoup(open(file))
+    schema = build_schema(args.docs_dir, args.api_version)
 
-    obj_properties = []
+    if args.classes:
+        print_classes(schema)
+        return
 
-    attr_table = soup.table
-    if attr_table:
-        for row in attr_table.findAll('tr'):
-            prop = row.td.text
-            if prop == 'Attribute':
-                continue 
-            obj_properties.append(prop)
+    output = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'schemas')
+    if not os.path.isdir(output):
+        os.makedirs(output)
 
-    obj_name = file[:-5]
-    line1 = "Unity%s = namedtuple_defaults('Unity%s', [" % (obj_name, obj_name)
-    print line1
-    for i in obj_properties:
-        print " " * len(line1) + "'%s'," % i
-    print " " * len(line1) + "])\n\n"
-    
+    path = os.path.join(output, '%s.json' % args.api_version)
+    schema.save(path)
+    print("Wrote %d types and %d enums to %s" % (len(schema.types), len(schema.enums), path))
 
-        
 
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,7 @@ import sys
 import argparse
 import logging
 import getpass
-from EMCUnity import *
+from EMCUnity import Unity
 
 global logger
 module = sys.modules['__main__'].__file__
@@ -4,7 +4,7 @@
 import sys
 import logging
 import getpass
-from EMCUnity import *
+from EMCUnity import Unity
 from enum import Enum
 from argparse import ArgumentParser
 
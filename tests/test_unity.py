@@ -0,0 +1,49 @@
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+from EMCUnity import Unity
+
+
+def _response(status=200, body=None, token='token'):
+    response = mock.Mock(status_code=status, headers={'emc-csrf-token': token})
+    response.json.return_value = body or {}
+    return response
+
+
+class LoginTest(unittest.TestCase):
+
+    def test_lazy_client_starting_with_a_post(self):
+        unity = Unity('unity.example.com', 'admin', 'pw', lazy=True)
+        unity.session.get = mock.Mock(return_value=_response())
+        unity.session.post = mock.Mock(return_value=_response(body={'content': {}}))
+
+        unity.post('/types/storageResource/action/createLun', {'name': 'lun1'})
+
+        # Logged in with a GET first, then sent the POST with its token
+        self.assertEqual(unity.session.get.call_args[1]['auth'], ('admin', 'pw'))
+        post_kwargs = unity.session.post.call_args[1]
+        self.assertNotIn('auth', post_kwargs)
+        self.assertEqual(post_kwargs['headers']['EMC-CSRF-TOKEN'], 'token')
+
+    def test_expired_session_on_a_post(self):
+        unity = Unity('unity.example.com', 'admin', 'pw', lazy=True)
+        unity.headers['EMC-CSRF-TOKEN'] = 'old'
+        unity.is_auth = True
+        unity.session.get = mock.Mock(return_value=_response(token='new'))
+        unity.session.post = mock.Mock(side_effect=[_response(401), _response()])
+
+        unity.post('/types/loginSessionInfo/action/logout')
+
+        # Logged in again with a GET and replayed the POST with the new token
+        self.assertEqual(unity.session.get.call_count, 1)
+        replay_kwargs = unity.session.post.call_args[1]
+        self.assertNotIn('auth', replay_kwargs)
+        self.assertEqual(replay_kwargs['headers']['EMC-CSRF-TOKEN'], 'new')
+
+
+if __name__ == '__main__':
+    unittest.main()
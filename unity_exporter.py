@@ -0,0 +1,7 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""Prometheus exporter for EMC Unity performance metrics"""
+from EMCUnity.UnityExporter import main
+
+if __name__ == '__main__':
+    main()